@@ -97,6 +97,8 @@ History
      Aug 2024, Matthias Cuntz
    * v2.3, deprecate ncio and plotting routines that became standalone
      packages, Oct 2024, Matthias Cuntz
+   * v2.4, import sub-packages color, functions, ncio, and jams only on
+     first access, Oct 2026, Matthias Cuntz
 
 """
 # version, author
@@ -108,17 +110,22 @@ except ImportError:  # pragma: no cover
 __author__  = "Matthias Cuntz, Juliane Mai, Stephan Thober, Arndt Piayda"
 
 # sub-packages without dependencies to rest of pyjams
-# color palettes and continuous color maps
-from . import color
 # physical, mathematical, computational, isotope, and material constants
 from . import const
-# variety of specialised functions
-from . import functions
-# netCDF4 functions to copy netcdf file while doing some transformations on
-# variables and dimensions.
-from . import ncio
-# old JAMS routines
-from . import jams
+# The following sub-packages are imported only on first access
+# (see __getattr__ below) because they import large packages such as
+# scipy.stats or matplotlib, or many modules such as jams.
+_lazy_subpackages = [
+    # color palettes and continuous color maps
+    'color',
+    # variety of specialised functions
+    'functions',
+    # netCDF4 functions to copy netcdf file while doing some transformations
+    # on variables and dimensions.
+    'ncio',
+    # old JAMS routines
+    'jams',
+]
 
 # air humidity calculations
 from .air_humidity import esat, eair2rhair, rhair2eair
@@ -189,6 +196,21 @@ from .tee import tee
 from .text2plot import text2plot, abc2plot, signature2plot
 
 
+def __getattr__(name):
+    """
+    Import sub-packages on first access, PEP 562
+    """
+    if name in _lazy_subpackages:
+        import importlib
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError(
+        'module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+def __dir__():
+    return sorted(list(globals()) + _lazy_subpackages)
+
+
 __all__ = ['__version__', '__author__',
            'color', 'const', 'functions',
            'esat',
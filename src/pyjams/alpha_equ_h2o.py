@@ -36,16 +36,58 @@ History
       types, Jan 2022, Matthias Cuntz
     * Use helper functions input2array and array2input,
       Jan 2022, Matthias Cuntz
+    * Calculate scalars without conversion to and from arrays,
+      Oct 2026, Matthias Cuntz
+    * Calculate exponential function in-place, Oct 2026, Matthias Cuntz
+    * Determine undefined values of ndarray input only once,
+      Oct 2026, Matthias Cuntz
+    * Coefficients in lookup table, Oct 2026, Matthias Cuntz
+    * No copy of ndarray input without undefined values,
+      Oct 2026, Matthias Cuntz
+    * Calculate in precision of input, e.g. numpy.float32,
+      Oct 2026, Matthias Cuntz
+    * Use exp(-x) for alpha < 1 and expm1 for epsilon,
+      Oct 2026, Matthias Cuntz
+    * Exponent as polynomial of 1/T, Oct 2026, Matthias Cuntz
+    * Lists and tuples like ndarrays without helper functions,
+      Oct 2026, Matthias Cuntz
+    * Set undefined values in-place, Oct 2026, Matthias Cuntz
+    * Use T0 from pyjams.const, Oct 2026, Matthias Cuntz
+    * Optional output array out, Oct 2026, Matthias Cuntz
+    * Isotope key also for unhashable input such as 0-d arrays,
+      Oct 2026, Matthias Cuntz
 
 """
+import numbers
 import numpy as np
-from .helper import input2array, array2input
+from .helper import isundef, input2array, array2input
+from .const import T0
 
 
 __all__ = ['alpha_equ_h2o']
 
 
-def alpha_equ_h2o(temp, isotope=None, undef=-9999., eps=False, greater1=True):
+# Coefficients a, b, c of the exponential function of Majoube (1971)
+_equ_coef = {1: (+2.4844e+4, -7.6248e+1, +5.261e-2),  # HDO
+             2: (+1.137e+3, -4.156e-1, -2.067e-3)}   # H218O
+
+# Input types that are calculated as ndarray and their output constructors
+_array_types = {np.ndarray: np.asarray, list: list, tuple: tuple}
+
+
+def _ftype(temp):
+    """
+    Floating point type for calculations: type of temp if it is single
+    precision or higher, otherwise double precision.
+    """
+    ftype = np.result_type(temp)
+    if (ftype.kind != 'f') or (ftype.itemsize < 4):
+        ftype = np.dtype(np.float64)
+    return ftype
+
+
+def alpha_equ_h2o(temp, isotope=None, undef=-9999., eps=False, greater1=True,
+                  out=None):
     """
     Isotopic fractionation factors during liquid-water vapour equilibration.
 
@@ -69,14 +111,30 @@ def alpha_equ_h2o(temp, isotope=None, undef=-9999., eps=False, greater1=True):
     greater1 : bool, optional
         alpha > 1 if True (default), which is not the atmospheric convention.
         alpha < 1 if False, which is the atmospheric convention.
+    out : ndarray, optional
+        Array with the same shape as `temp` in which the result is stored
+        if `temp` is a numpy.ndarray. It can be reused in repeated calls
+        to avoid the allocation of a new output array (default: None).
 
     Returns
     -------
     alpha / epsilon : float or array-like
-        Equilibrium fractionation factor (alpha) or fractionation (epsilon)
+        Equilibrium fractionation factor (alpha) or fractionation (epsilon).
+        Calculations are done in the floating point precision of `temp`,
+        e.g. single precision for numpy.float32, but at least in single
+        precision.
 
     Notes
     -----
+    Large arrays in single precision (numpy.float32) are calculated
+    several times faster than in double precision because NumPy uses
+    vectorised (SIMD) exponential functions for float32 on most CPUs.
+
+    The function works element-wise on ndarrays so that it can be used
+    chunk-wise with xarray and dask, for example:
+    ``xarray.apply_ufunc(alpha_equ_h2o, temp, kwargs={'isotope': 2},
+    dask='parallelized', output_dtypes=[temp.dtype])``.
+
     Majoube, M. (1971) Fractionnement en oxygene-18 entre la glace et la vapeur
         d'eau Journal De Chimie Physique Et De Physico-Chimie Biologique,
         68(4), 625-636.
@@ -103,38 +161,73 @@ def alpha_equ_h2o(temp, isotope=None, undef=-9999., eps=False, greater1=True):
     11.7187
 
     """
-    # Constants
-    T0 = 273.15  # Celcius <-> Kelvin [K]
     # Check input type
-    mtemp = input2array(temp, undef=undef, default=T0)
-
-    # Coefficients of exponential function
-    if (isotope == 1):    # HDO
-        a = +2.4844e+4
-        b = -7.6248e+1
-        c = +5.261e-2
-    elif (isotope == 2):  # H218O
-        a = +1.137e+3
-        b = -4.156e-1
-        c = -2.067e-3
+    if (out is not None) and (type(temp) is not np.ndarray):
+        raise ValueError('out only possible with numpy.ndarray input.')
+    if isinstance(temp, numbers.Number):
+        # scalar: calculate on numpy scalar without array conversions
+        if isundef(temp, undef):
+            return undef
+        ftype = _ftype(temp)
+        mtemp = ftype.type(temp)
+    elif type(temp) in _array_types:
+        # ndarray, list, tuple: determine undefined values only once
+        atemp = temp if type(temp) is np.ndarray else np.array(temp)
+        mask = isundef(atemp, undef)
+        hasundef = np.any(mask)
+        # use input directly if no undefined values
+        # Setting undefined values to T0 is faster than skipping them with
+        # the where keyword of the ufuncs, which disables their vectorised
+        # inner loops.
+        mtemp = np.where(mask, T0, atemp) if hasundef else atemp
+        ftype = _ftype(mtemp)
+        mtemp = mtemp.astype(ftype, copy=False)
     else:
-        a = 0.
-        b = 0.
-        c = 0.
-
-    # alpha+
-    out = np.exp( (a / mtemp + b) / mtemp + c)
+        mtemp = input2array(temp, undef=undef, default=T0)
+        ftype = _ftype(mtemp)
+
+    # Coefficients of exponential function in precision of input
+    # isotope key by comparison, e.g. for 0-d arrays that are unhashable
+    iso = 1 if isotope == 1 else 2 if isotope == 2 else 0
+    a, b, c = (ftype.type(cc) for cc in _equ_coef.get(iso, (0., 0., 0.)))
+
+    # exponent (a/T + b)/T + c as polynomial (a*u + b)*u + c of u = 1/T
+    # with one division and in-place, i.e. without further temporary arrays
+    u = ftype.type(1.) / mtemp
+    if out is None:
+        out = a * u
+    else:
+        np.multiply(a, u, out=out)
+    out += b
+    out *= u
+    out += c
 
-    # alpha-
+    # alpha- = 1/alpha+ = exp(-exponent)
+    # 0 - exponent instead of -exponent to avoid -0. for no fractionation
     if not greater1:
-        out = 1. / out
-
-    # epsilon
-    if eps:
-        out -= 1.
+        if isinstance(out, np.ndarray):
+            np.subtract(0., out, out=out)
+        else:
+            out = 0. - out
+
+    # alpha = exp(exponent) or epsilon = alpha - 1 = expm1(exponent)
+    expfunc = np.expm1 if eps else np.exp
+    if isinstance(out, np.ndarray):
+        expfunc(out, out=out)
+    else:
+        out = expfunc(out)
 
     # return same type as input type
-    out = array2input(out, temp, undef=undef)
+    if type(temp) in _array_types:
+        if hasundef:
+            # in-place, out is not a view of input
+            if isinstance(out, np.ndarray):
+                np.putmask(out, mask, undef)
+            else:
+                out = np.where(mask, undef, out)
+        out = _array_types[type(temp)](out)
+    elif not isinstance(temp, numbers.Number):
+        out = array2input(out, temp, undef=undef)
 
     return out
 
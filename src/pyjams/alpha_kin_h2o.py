@@ -21,13 +21,55 @@ History
     * Written, Sep 2014, Matthias Cuntz
     * Code refactoring, Nov 2021, Matthias Cuntz
     * More consistent docstrings, Jan 2022, Matthias Cuntz
+    * Fractionation factors in lookup table, Oct 2026, Matthias Cuntz
+    * Cache results because there are only few distinct outputs,
+      Oct 2026, Matthias Cuntz
+    * Precompute boundary layer fractionation factors,
+      Oct 2026, Matthias Cuntz
+    * Isotope key also for unhashable input such as 0-d arrays,
+      Oct 2026, Matthias Cuntz
+    * Cache in private function with hashable scalar arguments,
+      Oct 2026, Matthias Cuntz
 
 """
+from functools import lru_cache
 
 
 __all__ = ['alpha_kin_h2o']
 
 
+# Fractionation factors of HDO (1) and H218O (2)
+# of Merlivat (1978) (False) and Cappa et al. (2003) (True)
+_kin_alpha = {False: {1: 0.9755, 2: 0.9727},
+              True: {1: 0.9839, 2: 0.9691}}
+# Fractionation factors for diffusion through boundary layer: alpha**2/3
+_kin_alpha_boundary = {
+    cc: {ii: aa**(2./3.) for ii, aa in _kin_alpha[cc].items()}
+    for cc in _kin_alpha}
+
+
+# Cached fractionation factors, there are only few distinct outputs
+@lru_cache(maxsize=None)
+def _alpha_kin(isotope, eps, greater1, boundary, cappa):
+    # Fractionation factors
+    # isotope key by comparison, e.g. for 0-d arrays that are unhashable
+    iso = 1 if isotope == 1 else 2 if isotope == 2 else 0
+    if boundary:  # boundary layer
+        out = _kin_alpha_boundary[bool(cappa)].get(iso, 1.)
+    else:
+        out = _kin_alpha[bool(cappa)].get(iso, 1.)
+
+    # alpha+
+    if greater1:
+        out = 1./out
+
+    # epsilon
+    if eps:
+        out -= 1.
+
+    return out
+
+
 def alpha_kin_h2o(isotope=None, eps=False, greater1=True,
                   boundary=False, cappa=False):
     """
@@ -96,33 +138,15 @@ def alpha_kin_h2o(isotope=None, eps=False, greater1=True,
     -20.7076
 
     """
-    # Fractionation factors
-    if (isotope == 1):  # HDO
-        if cappa:
-            out = 0.9839
-        else:
-            out = 0.9755
-    elif (isotope == 2):  # H218O
-        if cappa:
-            out = 0.9691
-        else:
-            out = 0.9727
-    else:
-        out = 1.
-
-    # boundary layer
-    if boundary:
-        out = out**(2./3.)
-
-    # alpha+
-    if greater1:
-        out = 1./out
-
-    # epsilon
-    if eps:
-        out -= 1.
-
-    return out
+    # hashable scalar arguments for the cache,
+    # uncached calculation if not possible
+    try:
+        iso = 1 if isotope == 1 else 2 if isotope == 2 else 0
+        args = (iso, bool(eps), bool(greater1), bool(boundary), bool(cappa))
+    except (TypeError, ValueError):
+        return _alpha_kin.__wrapped__(isotope, eps, greater1, boundary,
+                                      cappa)
+    return _alpha_kin(*args)
 
 
 if __name__ == '__main__':
@@ -27,8 +27,23 @@ History
       May 2020, Matthias Cuntz
     * More consistent docstrings, Jan 2022, Matthias Cuntz
     * Support pandas.Series, Jun 2023, Matthias Cuntz
+    * Lookup tables of routines for exact input types, Oct 2026,
+      Matthias Cuntz
+    * Use C-level key functions in argmax and argmin of Python iterables,
+      Oct 2026, Matthias Cuntz
+    * Use numpy routines for long lists and tuples of numbers,
+      Oct 2026, Matthias Cuntz
+    * Bind numpy.ma.MaskedArray at module level, Oct 2026, Matthias Cuntz
+    * Use numpy.argsort already for shorter lists and with keyword
+      reverse, Oct 2026, Matthias Cuntz
+    * Keyword-only arguments in argsort of Python iterables, Oct 2026,
+      Matthias Cuntz
+    * Use own methods of other array types such as cupy.ndarray,
+      Oct 2026, Matthias Cuntz
 
 """
+from numbers import Real
+from operator import itemgetter
 import numpy as np
 import pandas as pd
 
@@ -36,6 +51,21 @@ import pandas as pd
 __all__ = ['argmax', 'argmin', 'argsort']
 
 
+# bind attribute lookups once
+_MaskedArray = np.ma.MaskedArray
+
+# routines for exact input types, subclasses are checked with isinstance
+_argmax_dispatch = {np.ndarray: np.argmax,
+                    np.ma.MaskedArray: np.ma.argmax,
+                    pd.Series: pd.Series.argmax}
+_argmin_dispatch = {np.ndarray: np.argmin,
+                    np.ma.MaskedArray: np.ma.argmin,
+                    pd.Series: pd.Series.argmin}
+_argsort_dispatch = {np.ndarray: np.argsort,
+                     np.ma.MaskedArray: np.ma.argsort,
+                     pd.Series: pd.Series.argsort}
+
+
 def argmax(a, *args, **kwargs):
     """
     Wrapper for numpy.argmax, numpy.ma.argmax, and max for Python iterables
@@ -70,6 +100,12 @@ def argmax(a, *args, **kwargs):
     argmax for iterables was taken from
     https://stackoverflow.com/questions/16945518/finding-the-index-of-the-value-which-is-the-min-or-max-in-python
 
+    Long lists and tuples of numbers are converted to numpy arrays
+    and passed to numpy.argmax.
+
+    Other array types with a method `argmax` such as pandas.Series or
+    cupy.ndarray use their own method, i.e. GPU arrays stay on the GPU.
+
     Examples
     --------
     One-dimensional array
@@ -131,11 +167,15 @@ def argmax(a, *args, **kwargs):
     1
 
     """
-    if isinstance(a, np.ma.MaskedArray):
+    func = _argmax_dispatch.get(type(a))
+    if func is not None:
+        return func(a, *args, **kwargs)
+    elif isinstance(a, _MaskedArray):
         return np.ma.argmax(a, *args, **kwargs)
     elif isinstance(a, np.ndarray):
         return np.argmax(a, *args, **kwargs)
-    elif isinstance(a, pd.Series):
+    elif hasattr(a, 'argmax'):
+        # pandas.Series, cupy.ndarray, etc.
         return a.argmax(*args, **kwargs)
     else:
         return _argmax(a)
@@ -175,6 +215,12 @@ def argmin(a, *args, **kwargs):
     argmin for iterables was taken from
     https://stackoverflow.com/questions/16945518/finding-the-index-of-the-value-which-is-the-min-or-max-in-python
 
+    Long lists and tuples of numbers are converted to numpy arrays
+    and passed to numpy.argmin.
+
+    Other array types with a method `argmin` such as pandas.Series or
+    cupy.ndarray use their own method, i.e. GPU arrays stay on the GPU.
+
     Examples
     --------
     One-dimensional array
@@ -236,11 +282,15 @@ def argmin(a, *args, **kwargs):
     0
 
     """
-    if isinstance(a, np.ma.MaskedArray):
+    func = _argmin_dispatch.get(type(a))
+    if func is not None:
+        return func(a, *args, **kwargs)
+    elif isinstance(a, _MaskedArray):
         return np.ma.argmin(a, *args, **kwargs)
     elif isinstance(a, np.ndarray):
         return np.argmin(a, *args, **kwargs)
-    elif isinstance(a, pd.Series):
+    elif hasattr(a, 'argmin'):
+        # pandas.Series, cupy.ndarray, etc.
         return a.argmin(*args, **kwargs)
     else:
         return _argmin(a)
@@ -286,6 +336,13 @@ def argsort(a, *args, **kwargs):
     http://stackoverflow.com/questions/3382352/equivalent-of-numpy-argsort-in-basic-python
     http://stackoverflow.com/questions/3071415/efficient-method-to-calculate-the-rank-vector-of-a-list-in-python
 
+    Long lists and tuples of numbers are converted to numpy arrays
+    and passed to numpy.argsort with a stable sorting algorithm if no
+    further arguments than `reverse` are given.
+
+    Other array types with a method `argsort` such as pandas.Series or
+    cupy.ndarray use their own method, i.e. GPU arrays stay on the GPU.
+
     Examples
     --------
     1D array
@@ -371,31 +428,85 @@ def argsort(a, *args, **kwargs):
     array([0, 1])
 
     """
-    if isinstance(a, np.ma.MaskedArray):
+    func = _argsort_dispatch.get(type(a))
+    if func is not None:
+        return func(a, *args, **kwargs)
+    elif isinstance(a, _MaskedArray):
         return np.ma.argsort(a, *args, **kwargs)
     elif isinstance(a, np.ndarray):
         return np.argsort(a, *args, **kwargs)
-    elif isinstance(a, pd.Series):
+    elif hasattr(a, 'argsort'):
+        # pandas.Series, cupy.ndarray, etc.
         return a.argsort(*args, **kwargs)
     else:
         return _argsort(a, *args, **kwargs)
 
 
+# key function returning the value of an (index, value) pair
+_itemgetter1 = itemgetter(1)
+
+# minimum length of lists and tuples that are converted to numpy arrays,
+# conversion costs more than it gains for shorter sequences
+_numpy_min = 512
+_numpy_min_sort = 256
+
+
+# numpy array of list or tuple of numbers, None otherwise
+# numpy must give the same results as the Python routines, i.e.
+# no NaN and no mixed integers and floats, which would lose precision
+def _asnumeric(seq, nmin=_numpy_min):
+    if (len(seq) < nmin) or (not isinstance(seq[0], Real)):
+        return None
+    arr = np.asarray(seq)
+    if arr.ndim != 1:
+        return None
+    if arr.dtype.kind in 'biu':
+        return arr
+    if arr.dtype.kind == 'f':
+        if np.isnan(arr).any():
+            return None
+        if any( issubclass(tt, (int, np.integer))
+                for tt in set(map(type, seq)) ):
+            return None
+        return arr
+    return None
+
+
 # same as numpy.argmax but for python iterables
 def _argmax(iterable):
-    return max(enumerate(iterable), key=lambda x: x[1])[0]
+    if isinstance(iterable, (list, tuple)):
+        arr = _asnumeric(iterable)
+        if arr is not None:
+            return int(np.argmax(arr))
+        return max(range(len(iterable)), key=iterable.__getitem__)
+    return max(enumerate(iterable), key=_itemgetter1)[0]
 
 
 # same as numpy.argmin but for python iterables
 def _argmin(iterable):
-    return min(enumerate(iterable), key=lambda x: x[1])[0]
+    if isinstance(iterable, (list, tuple)):
+        arr = _asnumeric(iterable)
+        if arr is not None:
+            return int(np.argmin(arr))
+        return min(range(len(iterable)), key=iterable.__getitem__)
+    return min(enumerate(iterable), key=_itemgetter1)[0]
 
 
 # same as numpy.argsort but for python iterables
-def _argsort(seq, *args, **kwargs):
-    if 'key' in kwargs:
+def _argsort(seq, *, key=None, reverse=False):
+    if key is not None:
         raise KeyError('keyword key cannot be given to argsort.')
-    return sorted(range(len(seq)), *args, key=seq.__getitem__, **kwargs)
+    if isinstance(seq, (list, tuple)):
+        arr = _asnumeric(seq, _numpy_min_sort)
+        if arr is not None:
+            # stable sort gives the same order as sorted
+            if reverse:
+                # keep order of equal elements in descending sort
+                nn = arr.size - 1
+                ii = nn - np.argsort(arr[::-1], kind='stable')
+                return ii[::-1].tolist()
+            return np.argsort(arr, kind='stable').tolist()
+    return sorted(range(len(seq)), key=seq.__getitem__, reverse=reverse)
 
 
 if __name__ == '__main__':
@@ -81,6 +81,79 @@ History
       Aug 2024, Matthias Cuntz
     * Filter UserWarning from cftime, Aug 2024, Matthias Cuntz
     * ensure_seconds keyword in date2num, Aug 2024, Matthias Cuntz
+    * Vectorized leap years of CF-calendars in _is_leap, Oct 2026,
+      Matthias Cuntz
+    * Vectorized _dates2decimal and _dates2absolute, Oct 2026,
+      Matthias Cuntz
+    * Module-level arrays of days per month, Oct 2026, Matthias Cuntz
+    * Check strftime formats only once, and only one time.strftime call
+      for strings without year, Oct 2026, Matthias Cuntz
+    * Gregorian leap years with fewer modulo operations, Oct 2026,
+      Matthias Cuntz
+    * Julian day with years starting in March in
+      _int_julian_day_from_date, Oct 2026, Matthias Cuntz
+    * Cache leap year checks of single years, Oct 2026, Matthias Cuntz
+    * Add timedelta with integer Julian days, which also corrects
+      timedeltas of more than a month in 360_day calendar, Oct 2026,
+      Matthias Cuntz
+    * Extract datetime fields with operator.attrgetter, Oct 2026,
+      Matthias Cuntz
+    * Calendar defaults of year zero and units from dictionaries,
+      Oct 2026, Matthias Cuntz
+    * Direct time.strftime for years 1900 to 9999 in _strftime,
+      Oct 2026, Matthias Cuntz
+    * Integer years in _is_leap without arrays, Oct 2026, Matthias Cuntz
+    * Vectorized _int_julian_day_from_dates, Oct 2026, Matthias Cuntz
+    * Lower-case calendar names only in public routines, Oct 2026,
+      Matthias Cuntz
+    * Only compute Julian or Gregorian day needed by calendar in
+      _int_julian_day_from_date, Oct 2026, Matthias Cuntz
+    * Month and day with np.searchsorted in _decimal2date, Oct 2026,
+      Matthias Cuntz
+    * Scalar leap years for fixed-length calendars in _decimal2date,
+      Oct 2026, Matthias Cuntz
+    * float64 instead of longdouble for float64 input in _decimal2date
+      and for 'month as %Y%m.%f' in _absolute2date, Oct 2026,
+      Matthias Cuntz
+    * np.divmod for splitting microseconds in _decimal2date and
+      _absolute2date, Oct 2026, Matthias Cuntz
+    * Read-only module-level arrays of days per month, Oct 2026,
+      Matthias Cuntz
+    * Construct datetime objects with np.frompyfunc in num2date,
+      Oct 2026, Matthias Cuntz
+    * Return arrays for Excel calendars without pyjams.datetime objects
+      in num2date, Oct 2026, Matthias Cuntz
+    * Leap years as int8 views of boolean arrays for indexing,
+      Oct 2026, Matthias Cuntz
+    * Round microseconds in-place, Oct 2026, Matthias Cuntz
+    * No copies of float arrays in _decimal2date and _absolute2date,
+      Oct 2026, Matthias Cuntz
+    * np.floor for years in _decimal2date, which corrects negative
+      integer decimal years, Oct 2026, Matthias Cuntz
+    * Return arrays for CF-calendars without pyjams.datetime objects
+      in num2date, Oct 2026, Matthias Cuntz
+    * Search months of leap years only on the subset of leap years
+      in _decimal2date, Oct 2026, Matthias Cuntz
+    * Fill datetime fields with np.fromiter without intermediate list
+      of tuples in _dates2arrays, Oct 2026, Matthias Cuntz
+    * Do not convert input dates twice in date2num, Oct 2026,
+      Matthias Cuntz
+    * Year and month with a single integer cast and np.divmod
+      for 'month as %Y%m.%f' in _absolute2date, Oct 2026,
+      Matthias Cuntz
+    * Constants of decimal calendars from a dictionary in _decimal2date,
+      Oct 2026, Matthias Cuntz
+    * In-place quotients of np.divmod in _decimal2date and
+      _absolute2date, Oct 2026, Matthias Cuntz
+    * cftime.datetime instance cf of datetime made on first access,
+      Oct 2026, Matthias Cuntz
+    * Month lengths from tables per calendar, which also corrects the
+      360_day calendar in datetime, Oct 2026, Matthias Cuntz
+    * Check time fields at once in datetime.assert_valid_date,
+      Oct 2026, Matthias Cuntz
+    * __slots__ in datetime class, Oct 2026, Matthias Cuntz
+    * strftime format with 4 or 5 digit years tested once per format
+      in num2date, Oct 2026, Matthias Cuntz
 
 ToDo
     * Check why datetime + timedelta but not timedelta + datetime
@@ -91,8 +164,12 @@ ToDo
     * strptime
 
 """
+from bisect import bisect_right
 from datetime import datetime as datetime_python
 from datetime import timedelta
+from functools import lru_cache, partial
+from itertools import chain
+from operator import attrgetter
 import re
 import time as ptime
 import warnings
@@ -107,6 +184,8 @@ __all__ = ['date2dec', 'date2num', 'dec2date', 'num2date', 'datetime']
 
 
 # supported calendars. Includes synonyms ('excel'=='excel1900')
+# Private routines expect lower-case calendar names, which are set in
+# date2num, num2date, and datetime.
 _excelcalendars = ['excel', 'excel1900', 'excel1904']
 _decimalcalendars = ['decimal', 'decimal360', 'decimal365', 'decimal366']
 _noncfcalendars = _excelcalendars + _decimalcalendars
@@ -115,6 +194,33 @@ _cfcalendars = ['standard', 'gregorian', 'proleptic_gregorian',
                 '360_day']
 _idealized_cfcalendars = ['all_leap', 'noleap', '366_day', '365_day',
                           '360_day']
+# calendars with fixed year lengths
+_fixed_calendars = ['decimal360', 'decimal365', 'decimal366'] + (
+    _idealized_cfcalendars)
+# calendars with closed-form integer Julian days and inverse
+_jday_calendars = (['decimal', 'proleptic_gregorian', 'julian'] +
+                   _excelcalendars + _fixed_calendars)
+
+# default year zero of calendars
+_year_zero_dict = {'standard': False, 'gregorian': False, 'julian': False,
+                   'proleptic_gregorian': True}  # ISO 8601 year zero=1 BC
+_year_zero_dict.update({ cal: True for cal in _idealized_cfcalendars })
+_year_zero_dict.update({ cal: False for cal in _excelcalendars })
+_year_zero_dict.update({ cal: True for cal in _decimalcalendars })
+# default units of calendars indexed by has_year_zero
+_units_dict = {}
+_units_dict.update({ cal: ('days since -4713-01-01 12:00:00',
+                           'days since -4712-01-01 12:00:00')
+                     for cal in ['standard', 'gregorian', 'julian'] })
+_units_dict['proleptic_gregorian'] = ('days since -4714-11-24 12:00:00',
+                                      'days since -4713-11-24 12:00:00')
+_units_dict.update({ cal: ('days since 0000-01-01 12:00:00',) * 2
+                     for cal in _idealized_cfcalendars })
+_units_dict.update({ cal: ('days since 1899-12-31 00:00:00',) * 2
+                     for cal in ['excel', 'excel1900'] })
+_units_dict['excel1904'] = ('days since 1903-12-31 00:00:00',) * 2
+_units_dict.update({ cal: ('days since 0001-01-01 00:00:00',) * 2
+                     for cal in _decimalcalendars })
 
 # number of days in year
 _dayspermonth      = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
@@ -126,6 +232,32 @@ _cumdayspermonth_leap = [0, 31, 60, 91, 121, 152, 182,
                          213, 244, 274, 305, 335, 366]
 _cumdayspermonth_360  = [0, 30, 60, 90, 120, 150, 180,
                          210, 240, 270, 300, 330, 360]
+# (non-leap, leap) tables per calendar
+_dayspermonth_dict = { cal: (_dayspermonth, _dayspermonth_leap)
+                       for cal in _cfcalendars + _noncfcalendars }
+_dayspermonth_dict.update({ cal: (_dayspermonth_360,) * 2
+                            for cal in ['decimal360', '360_day'] })
+_cumdayspermonth_dict = { cal: (_cumdayspermonth, _cumdayspermonth_leap)
+                          for cal in _cfcalendars + _noncfcalendars }
+_cumdayspermonth_dict.update({ cal: (_cumdayspermonth_360,) * 2
+                               for cal in ['decimal360', '360_day'] })
+# arrays indexed by [leap, month] with dummy month 0
+_diy     = np.array([ [-9] + _cumdayspermonth,
+                      [-9] + _cumdayspermonth_leap ])
+_diy_360 = np.array([ [-9] + _cumdayspermonth_360,
+                      [-9] + _cumdayspermonth_360 ])
+_dim     = np.array([ [-9] + _dayspermonth,
+                      [-9] + _dayspermonth_leap ])
+# tables are shared by all calls
+_diy.flags.writeable     = False
+_diy_360.flags.writeable = False
+_dim.flags.writeable     = False
+# decimal calendars: leap index (None = from year), days per year,
+# and cumulative days per month
+_decimal_dict = {'decimal':    (None, 365, _diy),
+                 'decimal360': (0, 360, _diy_360),
+                 'decimal365': (0, 365, _diy),
+                 'decimal366': (1, 366, _diy)}
 # feps = np.finfo(np.float64).eps
 deps = np.finfo(np.longdouble).eps
 
@@ -162,6 +294,11 @@ def to_tuple(dt):
             dt.second, dt.microsecond)
 
 
+# to_tuple in one call for use with map
+_get_ymdhmsms = attrgetter('year', 'month', 'day', 'hour', 'minute',
+                           'second', 'microsecond')
+
+
 # factory function without optional kwargs that can be used in
 # datetime.__reduce_
 def _create_datetime(date_type, args, kwargs):
@@ -172,12 +309,10 @@ def _create_datetime(date_type, args, kwargs):
 # Adapted cftime routines
 #
 
-# Every 28 years the calendar repeats, except through century leap
-# years where it's 6 years. But only if you're using the Gregorian
-# calendar. ;-)
-# Make also 4-digit negative years
-# Allow .%f for microseconds
-def _strftime(dt, fmt):
+# Check format and split off .%f for microseconds
+# Formats are checked only once
+@lru_cache(maxsize=256)
+def _strftime_format(fmt):
     if _illegal_s.search(fmt):
         raise TypeError("This strftime implementation does not handle %s")
     if '%f' in fmt:
@@ -190,12 +325,25 @@ def _strftime(dt, fmt):
     else:
         ihavems = False
         fmt1 = fmt
+    return fmt1, ihavems
 
-    # don't use strftime method at all.
-    # if dt.year > 1900:
-    #    return dt.strftime(fmt)
 
+# Every 28 years the calendar repeats, except through century leap
+# years where it's 6 years. But only if you're using the Gregorian
+# calendar. ;-)
+# Make also 4-digit negative years
+# Allow .%f for microseconds
+def _strftime(dt, fmt):
+    fmt1, ihavems = _strftime_format(fmt)
+
+    # time.strftime handles 4-digit years from 1900 on all platforms
     year = dt.year
+    if 1900 <= year <= 9999:
+        s = ptime.strftime(fmt1, dt.timetuple())
+        if ihavems:
+            s = s + '.{:06d}'.format(dt.microsecond)
+        return s
+
     # For every non-leap year century, advance by
     # 6 years to get into the 28-year repeat cycle
     delta = 2000 - year
@@ -205,18 +353,20 @@ def _strftime(dt, fmt):
     # Move to around the year 2000
     year = year + ((2000 - year) // 28) * 28
     # timetuple does not include microseconds
-    timetuple = dt.timetuple()
     # time.strftime does hence not treat microseconds. i.e. format code %f
-    s1 = ptime.strftime(fmt1, (year,) + timetuple[1:])
+    # all but the year are reused for both time.strftime calls
+    tail = dt.timetuple()[1:]
+    s1 = ptime.strftime(fmt1, (year,) + tail)
     sites1 = _findall(s1, str(year))
 
-    s2 = ptime.strftime(fmt1, (year + 28,) + timetuple[1:])
-    sites2 = _findall(s2, str(year + 28))
-
     sites = []
-    for site in sites1:
-        if site in sites2:
-            sites.append(site)
+    # no year in the string, e.g. only time, if no sites1
+    if sites1:
+        s2 = ptime.strftime(fmt1, (year + 28,) + tail)
+        sites2 = _findall(s2, str(year + 28))
+        for site in sites1:
+            if site in sites2:
+                sites.append(site)
 
     s = s1
     if dt.year < 0:
@@ -277,27 +427,25 @@ def _year_zero_defaults(calendar):
 
     Examples
     --------
-    >>> print(_year_zero_defaults('Excel'))
+    >>> print(_year_zero_defaults('excel'))
     False
     >>> print(_year_zero_defaults('decimal'))
     True
 
     """
-    calendar = calendar.lower()
-    if calendar in ['standard', 'gregorian', 'julian']:
-        return False
-    elif calendar in ['proleptic_gregorian']:
-        return True  # ISO 8601 year zero=1 BC
-    elif calendar in _idealized_cfcalendars:
-        return True
-    elif calendar in _excelcalendars:
-        return False
-    elif calendar in _decimalcalendars:
-        return True
-    else:
+    try:
+        return _year_zero_dict[calendar]
+    except KeyError:
         raise ValueError(f'Unknown calendar: {calendar}')
 
 
+# Leap years in the Gregorian calendar of integer year(s)
+# year % 400 == 0 is the same as year % 16 == 0 for multiples of 25,
+# which saves modulo operations and temporary arrays
+def _is_leap_gregorian(year):
+    return ((year & 3) == 0) & (((year % 25) != 0) | ((year & 15) == 0))
+
+
 def _is_leap(year, calendar, has_year_zero=None):
     """
     Determines if a specific year in a given calendar is a leap year
@@ -338,10 +486,13 @@ def _is_leap(year, calendar, has_year_zero=None):
     >>> years = [1900, 1904]
     >>> print(_is_leap(years, 'decimal'))
     [False, True]
-    >>> print(_is_leap(years, 'Excel'))
+    >>> print(_is_leap(years, 'excel'))
     [True, True]
 
     """
+    if isinstance(year, (int, np.integer)):
+        return _is_leap_year(int(year), calendar, has_year_zero)
+
     myear = input2array(year, default=1990)
 
     # set calendar-specific defaults for has_year_zero
@@ -353,32 +504,64 @@ def _is_leap(year, calendar, has_year_zero=None):
     if np.any(myear == 0) and (not has_year_zero):
         raise ValueError(f'year 0 does not exist in the calendar {calendar}')
 
-    if calendar in _cfcalendars:
-        leap = [ cf.is_leap_year(yy, calendar, has_year_zero) for yy in myear ]
+    # If there is no year 0 in the calendar, years -1, -5, -9, etc.
+    # are leap years. year 0 is a leap year if it exists.
+    if not has_year_zero:
+        myear = np.where(myear < 0, myear + 1, myear)
+
+    if calendar in ['julian'] + _excelcalendars:
+        # Excel calendars are supposedly Julian calendars
+        leap = (myear % 4) == 0
+    elif calendar in ['decimal', 'proleptic_gregorian']:
+        leap = _is_leap_gregorian(myear)
+    elif calendar in ['standard', 'gregorian']:
+        # Julian calendar before 1583, Gregorian calendar afterwards
+        leap = ( _is_leap_gregorian(myear) |
+                 (((myear & 3) == 0) & (myear < 1583)) )
+    elif calendar in ['decimal360', 'decimal365', 'noleap', '365_day',
+                      '360_day']:
+        leap = np.zeros_like(myear, dtype=bool)
+    elif calendar in ['decimal366', 'all_leap', '366_day']:
+        leap = np.ones_like(myear, dtype=bool)
     else:
-        # If there is no year 0 in the calendar, years -1, -5, -9, etc.
-        # are leap years. year 0 is a leap year if it exists.
-        if not has_year_zero:
-            myear = np.where(myear < 0, myear + 1, myear)
-
-        if calendar in _excelcalendars:
-            # Excel calendars are supposedly Julian calendars
-            leap = (myear % 4) == 0
-        elif calendar == 'decimal':
-            leap = ( (((myear % 4) == 0) & ((myear % 100) != 0)) |
-                     ((myear % 400) == 0) )
-        elif calendar in ['decimal360', 'decimal365']:
-            leap = np.zeros_like(myear, dtype=bool)
-        elif calendar == 'decimal366':
-            leap = np.ones_like(myear, dtype=bool)
-        else:
-            raise ValueError(f'Calendar not known: {calendar}')
+        raise ValueError(f'Calendar not known: {calendar}')
 
     oleap = array2input(leap, year)
 
     return oleap
 
 
+# Cached check of single integer years, which recur in date arithmetic
+# Same as _is_leap with Python integers instead of arrays
+@lru_cache(maxsize=4096)
+def _is_leap_year(year, calendar, has_year_zero=None):
+    if has_year_zero is None:
+        has_year_zero = _year_zero_defaults(calendar)
+
+    if has_year_zero and (calendar in _excelcalendars):
+        raise ValueError('year 0 not allowed with Excel calendars')
+    if (year == 0) and (not has_year_zero):
+        raise ValueError(f'year 0 does not exist in the calendar {calendar}')
+
+    if (not has_year_zero) and (year < 0):
+        year += 1
+
+    if calendar in ['julian'] + _excelcalendars:
+        return (year & 3) == 0
+    elif calendar in ['decimal', 'proleptic_gregorian']:
+        return bool(_is_leap_gregorian(year))
+    elif calendar in ['standard', 'gregorian']:
+        return bool(_is_leap_gregorian(year) |
+                    (((year & 3) == 0) & (year < 1583)))
+    elif calendar in ['decimal360', 'decimal365', 'noleap', '365_day',
+                      '360_day']:
+        return False
+    elif calendar in ['decimal366', 'all_leap', '366_day']:
+        return True
+    else:
+        raise ValueError(f'Calendar not known: {calendar}')
+
+
 def _month_lengths(year, calendar, has_year_zero=None):
     """
     Number of days of the 12 months in specific year for a given calendar
@@ -407,14 +590,8 @@ def _month_lengths(year, calendar, has_year_zero=None):
     [30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30]
 
     """
-    leap = _is_leap(year, calendar, has_year_zero)
-    if calendar == 'decimal360':
-        return _dayspermonth_360
-    else:
-        if leap:
-            return _dayspermonth_leap
-        else:
-            return _dayspermonth
+    leap = _is_leap_year(year, calendar, has_year_zero)
+    return _dayspermonth_dict[calendar][leap]
 
 
 def _int_julian_day_from_date(year, month, day, calendar,
@@ -453,8 +630,6 @@ def _int_julian_day_from_date(year, month, day, calendar,
     ignored unless calendar = 'standard' or 'gregorian'.
 
     """
-    if calendar:
-        calendar = calendar.lower()
     if has_year_zero is None:
         has_year_zero = _year_zero_defaults(calendar)
     if (calendar == 'decimal360') or (calendar == '360_day'):
@@ -467,65 +642,193 @@ def _int_julian_day_from_date(year, month, day, calendar,
            (calendar == 'all_leap')):
         return year * 366 + _cumdayspermonth_leap[month - 1] + day - 1
     else:
-        leap = _is_leap(year, calendar, has_year_zero=has_year_zero)
-        if leap:
-            jday = day + _cumdayspermonth_leap[month - 1]
-        else:
-            jday = day + _cumdayspermonth[month - 1]
+        if has_year_zero and (calendar in _excelcalendars):
+            raise ValueError('year 0 not allowed with Excel calendars')
+        if (year == 0) and (not has_year_zero):
+            raise ValueError(f'year 0 does not exist in the calendar'
+                             f' {calendar}')
         # If there is no year 0, years -1, -5, -9, etc,
         # are leap years. year zero is a leap year if it exists.
         if (year < 0) and (not has_year_zero):
             year += 1
-        if calendar == 'decimal':
-            # 1st term is the number of days in the last year
-            # 2nd term is the number of days in each preceding non-leap year
-            # last terms are the number of preceding leap years
-            jday_greg = (jday + 365 * (year - 1) +
-                         (year - 1) // 4 - (year - 1) // 100 +
-                         (year - 1) // 400)
-            return jday_greg
-        elif (calendar in _excelcalendars) or (calendar == 'julian'):
-            year += 4800  # add offset so -4800 is year 0.
-            # 1st term is the number of days in the last year
-            # 2nd term is the number of days in each preceding non-leap year
-            # last terms are the number of preceding leap years
-            jday_jul = jday + 365 * (year - 1) + (year - 1) // 4
-            # remove offset for 87 years before -4713 (including leap days)
-            jday_jul -= 31777
-            return jday_jul
-        elif ( (calendar == 'standard') or (calendar == 'gregorian') or
-               (calendar == 'proleptic_gregorian') ):
-            year += 4800  # add offset so -4800 is year 0.
-            # 1st term is the number of days in the last year
-            # 2nd term is the number of days in each preceding non-leap year
-            # last terms are the number of preceding leap years since -4800
-            jday_jul = jday + 365 * (year - 1) + (year - 1) // 4
+        # Years start in March so that leap days are at the end of years,
+        # cf. Neri and Reingold (2021) arXiv:2102.06959
+        # and days of the months March to February follow (153 * m + 2) // 5
+        ijan = (14 - month) // 12  # 1 for January and February
+        year += 4800 - ijan  # add offset so -4800 is year 0.
+        month += 12 * ijan - 3  # 0 is March
+        # 1st term is the number of days in the last year
+        # 2nd term is the number of days in each preceding non-leap year
+        # 3rd term is the number of preceding leap years since -4800
+        jday = day + (153 * month + 2) // 5 + 365 * year + year // 4
+        if calendar == 'proleptic_gregorian':
+            # add Gregorian century rules, remove offset, and account for
+            # the fact that -4713/1/1 is jday=38 in gregorian calendar.
+            return jday - year // 100 + year // 400 - 32045
+        elif (calendar == 'julian') or (calendar in _excelcalendars):
             # remove offset for 87 years before -4713 (including leap days)
-            jday_jul -= 31777
-            jday_greg = (jday + 365 * (year - 1) +
-                         (year - 1) // 4 - (year - 1) // 100 +
-                         (year - 1) // 400)
-            # remove offset, and account for the fact that -4713/1/1 is jday=38
-            # in gregorian calendar.
-            jday_greg -= 31739
-            if calendar == 'proleptic_gregorian':
-                return jday_greg
+            return jday - 32083
+        elif calendar == 'decimal':
+            # add Gregorian century rules and remove offset of 0001-01-01
+            return jday - year // 100 + year // 400 - 1753470
+        elif (calendar == 'standard') or (calendar == 'gregorian'):
+            # Julian calendar before 1582 October 15
+            jday_jul = jday - 32083
+            if jday_jul < 2299161:
+                return jday_jul
+            # check for invalid days in mixed calendar
+            # (there are 10 missing)
+            if jday_jul < 2299171:
+                raise ValueError('invalid date in mixed calendar')
+            jday_greg = jday - year // 100 + year // 400 - 32045
+            if skip_transition:
+                return jday_greg + 10
             else:
-                # check for invalid days in mixed calendar
-                # (there are 10 missing)
-                if jday_jul >= 2299161 and jday_jul < 2299171:
-                    raise ValueError('invalid date in mixed calendar')
-                if jday_jul < 2299161:  # 1582 October 15
-                    return jday_jul
-                else:
-                    if skip_transition:
-                        return jday_greg + 10
-                    else:
-                        return jday_greg
+                return jday_greg
+        else:
+            raise ValueError(f'Unknown calendar: {calendar}')
+
+
+def _int_julian_day_from_dates(year, month, day, calendar,
+                               skip_transition=False, has_year_zero=None):
+    """
+    Compute integer Julian Days from arrays of year, month, day,
+    and calendar
+
+    Vectorized version of :func:`_int_julian_day_from_date`.
+
+    Parameters
+    ----------
+    year, month, day : array_like of int
+        Years, months, and days
+    calendar : str
+        One of the supported calendar names in *_cfcalendars* and
+        *_noncfcalendars*
+    skip_transition : bool, optional
+        Leave a 10-day gap in Julian day numbers between Oct 4 and
+        Oct 15 1582 in the calendars *standard* and *gregorian*
+        (default: False).
+    has_year_zero : bool, optional
+        Astronomical year numbering is used, i.e. year zero exists, if True
+        and possible for the given *calendar*. If *None* (default),
+        calendar-specific defaults are assumed.
+
+    Returns
+    -------
+    array of int64
+       Integer Julian Days
+
+    Examples
+    --------
+    >>> jday = _int_julian_day_from_dates([1990, 1991], [1, 2], [1, 3],
+    ...                                   'proleptic_gregorian')
+    >>> print(jday)
+    [2447893 2448291]
+
+    """
+    year = np.asarray(year, dtype=np.int64)
+    month = np.asarray(month, dtype=np.int64)
+    day = np.asarray(day, dtype=np.int64)
+    if has_year_zero is None:
+        has_year_zero = _year_zero_defaults(calendar)
+    if (calendar == 'decimal360') or (calendar == '360_day'):
+        return year * 360 + _diy_360[0, month] + day - 1
+    elif ( (calendar == 'decimal365') or (calendar == '365_day') or
+           (calendar == 'noleap')):
+        return year * 365 + _diy[0, month] + day - 1
+    elif ( (calendar == 'decimal366') or (calendar == '366_day') or
+           (calendar == 'all_leap')):
+        return year * 366 + _diy[1, month] + day - 1
+    else:
+        if has_year_zero and (calendar in _excelcalendars):
+            raise ValueError('year 0 not allowed with Excel calendars')
+        if (not has_year_zero) and np.any(year == 0):
+            raise ValueError(f'year 0 does not exist in the calendar'
+                             f' {calendar}')
+        if not has_year_zero:
+            year = np.where(year < 0, year + 1, year)
+        # cf. _int_julian_day_from_date
+        ijan = (14 - month) // 12
+        year = year + 4800 - ijan
+        month = month + 12 * ijan - 3
+        jday = day + (153 * month + 2) // 5 + 365 * year + year // 4
+        if calendar == 'decimal':
+            return jday - year // 100 + year // 400 - 1753470
+        elif (calendar in _excelcalendars) or (calendar == 'julian'):
+            return jday - 32083
+        elif calendar == 'proleptic_gregorian':
+            return jday - year // 100 + year // 400 - 32045
+        elif (calendar == 'standard') or (calendar == 'gregorian'):
+            jday_jul = jday - 32083
+            jday_greg = jday - year // 100 + year // 400 - 32045
+            if np.any((jday_jul >= 2299161) & (jday_jul < 2299171)):
+                raise ValueError('invalid date in mixed calendar')
+            if skip_transition:
+                jday_greg += 10
+            return np.where(jday_jul < 2299161, jday_jul, jday_greg)
         else:
             raise ValueError(f'Unknown calendar: {calendar}')
 
 
+def _date_from_int_julian_day(jday, calendar, has_year_zero=None):
+    """
+    Compute year, month, day from integer Julian Day and calendar
+
+    Inverse of :func:`_int_julian_day_from_date` with
+    skip_transition=False.
+
+    """
+    if has_year_zero is None:
+        has_year_zero = _year_zero_defaults(calendar)
+    if (calendar == 'decimal360') or (calendar == '360_day'):
+        year, doy = divmod(jday, 360)
+        return year, doy // 30 + 1, doy % 30 + 1
+    elif ( (calendar == 'decimal365') or (calendar == '365_day') or
+           (calendar == 'noleap')):
+        year, doy = divmod(jday, 365)
+        month = bisect_right(_cumdayspermonth, doy)
+        return year, month, doy - _cumdayspermonth[month - 1] + 1
+    elif ( (calendar == 'decimal366') or (calendar == '366_day') or
+           (calendar == 'all_leap')):
+        year, doy = divmod(jday, 366)
+        month = bisect_right(_cumdayspermonth_leap, doy)
+        return year, month, doy - _cumdayspermonth_leap[month - 1] + 1
+    else:
+        if calendar == 'decimal':
+            # add offset of 0001-01-01
+            jday += 1721425
+            isgreg = True
+        elif (calendar in _excelcalendars) or (calendar == 'julian'):
+            isgreg = False
+        elif calendar == 'proleptic_gregorian':
+            isgreg = True
+        elif (calendar == 'standard') or (calendar == 'gregorian'):
+            isgreg = jday >= 2299161  # 1582 October 15
+        else:
+            raise ValueError(f'Unknown calendar: {calendar}')
+        # Years start in March, and -4800 is year 0,
+        # cf. _int_julian_day_from_date
+        if isgreg:
+            # 400-year cycles
+            cycle = (4 * (jday + 32044) + 3) // 146097
+            jday = jday + 32044 - (146097 * cycle) // 4
+        else:
+            cycle = 0
+            jday = jday + 32082
+        # years since -4800 or start of cycle, and day of year
+        year = (4 * jday + 3) // 1461
+        doy = jday - (1461 * year) // 4
+        # month with 0 being March
+        month = (5 * doy + 2) // 153
+        day = doy - (153 * month + 2) // 5 + 1
+        year += 100 * cycle - 4800 + month // 10
+        month += 3 - 12 * (month // 10)
+        # If there is no year 0, year before 1 is -1
+        if (year < 1) and (not has_year_zero):
+            year -= 1
+        return year, month, day
+
+
 # Add a datetime.timedelta to a pyjams.datetime instance. Uses
 # integer arithmetic to avoid rounding errors and preserve
 # microsecond accuracy.
@@ -560,6 +863,18 @@ def _add_timedelta(dt, delta):
 
     delta_days += extra_days
 
+    # shift days with integer Julian day
+    # except in mixed Julian/Gregorian calendars, where 1582-10-05 to
+    # 1582-10-14 are not skipped here, and in calendars with fixed year
+    # lengths without year 0, which are not skipped in Julian days
+    if ( (calendar in _jday_calendars) and
+         (has_year_zero or (calendar not in _fixed_calendars)) ):
+        jday = _int_julian_day_from_date(year, month, day, calendar,
+                                         has_year_zero=has_year_zero)
+        year, month, day = _date_from_int_julian_day(
+            jday + delta_days, calendar, has_year_zero=has_year_zero)
+        return (year, month, day, hour, minute, second, microsecond)
+
     while delta_days < 0:
         # not done compared to cftime because Excel dates > 1900 and
         # decimal dates include 1582-10-05 to 1582-10-14
@@ -648,33 +963,102 @@ def _units_defaults(calendar, has_year_zero=None):
 
     Examples
     --------
-    >>> print(_units_defaults('Excel'))
+    >>> print(_units_defaults('excel'))
     'days since 1899-12-31 00:00:00'
 
     """
-    calendar = calendar.lower()
+    try:
+        units = _units_dict[calendar]
+    except KeyError:
+        raise ValueError(f'Unknown calendar: {calendar}')
     if has_year_zero is None:
-        has_year_zero = _year_zero_defaults(calendar)
-    if calendar in ['standard', 'gregorian', 'julian']:
-        if has_year_zero:
-            return 'days since -4712-01-01 12:00:00'
-        else:
-            return 'days since -4713-01-01 12:00:00'
-    elif calendar in ['proleptic_gregorian']:
-        if has_year_zero:
-            return 'days since -4713-11-24 12:00:00'
+        has_year_zero = _year_zero_dict[calendar]
+    return units[bool(has_year_zero)]
+
+
+def _dates2arrays(dates):
+    """
+    Arrays of year, month, day, hour, minute, second, microsecond
+    from datetime objects
+
+    Parameters
+    ----------
+    dates : array_like of datetime instances
+        Instances of datetime classes such as pyjams.datetime
+
+    Returns
+    -------
+    tuple
+       int64 arrays of year, month, day, hour, minute, second, microsecond
+
+    Examples
+    --------
+    >>> dt = [datetime(1990, 1, 1), datetime(1991, 2, 3)]
+    >>> yr, mo, dy, hr, mi, sc, ms = _dates2arrays(dt)
+    >>> print(yr, mo, dy)
+    [1990 1991] [1 2] [1 3]
+
+    """
+    dates = list(dates)
+    out = np.fromiter(chain.from_iterable(map(_get_ymdhmsms, dates)),
+                      dtype=np.int64, count=7 * len(dates))
+    return tuple(out.reshape(-1, 7).T)
+
+
+# strftime formats with 4 or 5 digit years per
+# (format, year format, datetime class)
+_year_format_cache = {}
+
+
+def _year_format(format, dt, negative=False):
+    """
+    strftime format with 4 digit years, or 5 digits for negative years
+
+    Assures 4 digit years on all platforms,
+    see https://github.com/python/cpython/issues/76376.
+    The platform's strftime is tested once per format and datetime class.
+
+    Parameters
+    ----------
+    format : str
+        strftime format
+    dt : datetime instance
+        Instance of datetime classes such as pyjams.datetime used
+        to test strftime
+    negative : bool, optional
+        Use 5 digits for the year if True, e.g. for negative years
+        (default: False)
+
+    Returns
+    -------
+    str
+       *format* with %Y replaced by %04Y or %05Y if supported by strftime
+
+    Examples
+    --------
+    >>> print(_year_format('%Y-%m-%d', datetime(990, 1, 1)))
+    %04Y-%m-%d
+
+    """
+    if '%Y' not in format:
+        return format
+    y4 = '%05Y' if negative else '%04Y'
+    key = (format, y4, type(dt))
+    try:
+        return _year_format_cache[key]
+    except KeyError:
+        pass
+    format04 = format.replace('%Y', y4)
+    try:
+        dttest = dt.strftime(format04)
+        if ('4Y' in dttest) or ('5Y' in dttest):
+            iform = format
         else:
-            return 'days since -4714-11-24 12:00:00'
-    elif calendar in _idealized_cfcalendars:
-        return 'days since 0000-01-01 12:00:00'
-    elif calendar in ['excel', 'excel1900']:
-        return 'days since 1899-12-31 00:00:00'
-    elif calendar in ['excel1904']:
-        return 'days since 1903-12-31 00:00:00'
-    elif calendar in _decimalcalendars:
-        return 'days since 0001-01-01 00:00:00'
-    else:
-        raise ValueError(f'Unknown calendar: {calendar}')
+            iform = format04
+    except ValueError:
+        iform = format
+    _year_format_cache[key] = iform
+    return iform
 
 
 def _date2decimal(date, calendar):
@@ -702,40 +1086,7 @@ def _date2decimal(date, calendar):
     1990.
 
     """
-    year     = date.year
-    month    = date.month
-    day      = np.longdouble(date.day)
-    hour     = np.longdouble(date.hour)
-    minute   = np.longdouble(date.minute)
-    second   = np.longdouble(date.second)
-    msecond  = np.longdouble(date.microsecond)
-    calendar = calendar.lower()
-
-    days_year = np.longdouble(365)
-    diy = np.array([ [-9] + _cumdayspermonth,
-                     [-9] + _cumdayspermonth_leap ], dtype=np.longdouble)
-    if calendar == 'decimal':
-        leap = int( (((year % 4) == 0) & ((year % 100) != 0)) |
-                    ((year % 400) == 0) )
-    elif calendar == 'decimal360':
-        leap = 0
-        days_year = np.longdouble(360)
-        diy  = np.array([ [-9] + _cumdayspermonth_360,
-                          [-9] + _cumdayspermonth_360 ], dtype=np.longdouble)
-    elif calendar == 'decimal365':
-        leap = 0
-    elif calendar == 'decimal366':
-        leap = 1
-    fleap = np.longdouble(leap)
-    tday  = diy[leap, month] + day
-    thour = ( (tday - 1.) * 24. +
-              hour +
-              minute / 60. +
-              second / 3600. +
-              msecond / 3600000000. )
-    out = np.longdouble(year) + thour / ((days_year + fleap) * 24.)
-
-    return out
+    return _dates2decimal([date], calendar)[0]
 
 
 def _dates2decimal(dates, calendar):
@@ -764,9 +1115,30 @@ def _dates2decimal(dates, calendar):
 
     """
     mdates = input2array(dates, default=datetime(1990, 1, 1))
+    year, month, day, hour, minute, second, msecond = _dates2arrays(mdates)
 
-    # wrapper might be slow
-    out = [ _date2decimal(dd, calendar) for dd in mdates ]
+    # leap is 0/1 index array only for decimal calendar, scalar otherwise
+    days_year = np.longdouble(365)
+    diy = _diy
+    if calendar == 'decimal':
+        leap = _is_leap_gregorian(year).view(np.int8)
+    elif calendar == 'decimal360':
+        leap = 0
+        days_year = np.longdouble(360)
+        diy = _diy_360
+    elif calendar == 'decimal365':
+        leap = 0
+    elif calendar == 'decimal366':
+        leap = 1
+    else:
+        raise ValueError(f'Unknown decimal calendar: {calendar}')
+    tday  = (diy[leap, month] + day).astype(np.longdouble)
+    thour = ( (tday - 1.) * 24. +
+              hour.astype(np.longdouble) +
+              minute.astype(np.longdouble) / 60. +
+              second.astype(np.longdouble) / 3600. +
+              msecond.astype(np.longdouble) / 3600000000. )
+    out = year.astype(np.longdouble) + thour / ((days_year + leap) * 24.)
 
     out = array2input(out, dates)
     return out
@@ -796,43 +1168,7 @@ def _date2absolute(date, units):
     19900101.0
 
     """
-    year     = date.year
-    month    = date.month
-    day      = np.longdouble(date.day)
-    hour     = np.longdouble(date.hour)
-    minute   = np.longdouble(date.minute)
-    second   = np.longdouble(date.second)
-    msecond  = np.longdouble(date.microsecond)
-
-    if units == 'day as %Y%m%d.%f':
-        tday  = (np.longdouble(year) * 10000. +
-                 np.longdouble(month) * 100. +
-                 day)
-        thour = (hour +
-                 minute / 60. +
-                 second / 3600. +
-                 msecond / 3600000000.)
-        out = tday + thour / 24.
-    elif units == 'month as %Y%m.%f':
-        leap = int( (((year % 4) == 0) & ((year % 100) != 0)) |
-                    ((year % 400) == 0) )
-        dim = np.array([ [-9] + _dayspermonth,
-                         [-9] + _dayspermonth_leap ], dtype=np.longdouble)
-        tmonth = (np.longdouble(year) * 100. +
-                  np.longdouble(month))
-        thour = (day * 24. +
-                 hour +
-                 minute / 60. +
-                 second / 3600. +
-                 msecond / 3600000000.)
-        out = tmonth + thour / (dim[leap, month] * 24.)
-    elif units == 'year as %Y.%f':
-        # same as decimal date
-        out = _date2decimal(date, 'decimal')
-    else:
-        raise ValueError(f'Unknown absolute units: {units}')
-
-    return out
+    return _dates2absolute([date], units)[0]
 
 
 def _dates2absolute(dates, units):
@@ -861,8 +1197,35 @@ def _dates2absolute(dates, units):
     """
     mdates = input2array(dates, default=datetime(1990, 1, 1))
 
-    # wrapper might be slow
-    out = [ _date2absolute(dd, units) for dd in mdates ]
+    if units == 'day as %Y%m%d.%f':
+        year, month, day, hour, minute, second, msecond = _dates2arrays(
+            mdates)
+        tday  = (year.astype(np.longdouble) * 10000. +
+                 month.astype(np.longdouble) * 100. +
+                 day.astype(np.longdouble))
+        thour = (hour.astype(np.longdouble) +
+                 minute.astype(np.longdouble) / 60. +
+                 second.astype(np.longdouble) / 3600. +
+                 msecond.astype(np.longdouble) / 3600000000.)
+        out = tday + thour / 24.
+    elif units == 'month as %Y%m.%f':
+        year, month, day, hour, minute, second, msecond = _dates2arrays(
+            mdates)
+        leap = _is_leap_gregorian(year).view(np.int8)
+        tmonth = (year.astype(np.longdouble) * 100. +
+                  month.astype(np.longdouble))
+        thour = (day.astype(np.longdouble) * 24. +
+                 hour.astype(np.longdouble) +
+                 minute.astype(np.longdouble) / 60. +
+                 second.astype(np.longdouble) / 3600. +
+                 msecond.astype(np.longdouble) / 3600000000.)
+        dim = _dim[leap, month].astype(np.longdouble)
+        out = tmonth + thour / (dim * 24.)
+    elif units == 'year as %Y.%f':
+        # same as decimal date
+        out = _dates2decimal(mdates, 'decimal')
+    else:
+        raise ValueError(f'Unknown absolute units: {units}')
 
     out = array2input(out, dates)
     return out
@@ -902,67 +1265,71 @@ def _decimal2date(times, calendar):
     # should try similar to decode_dates_from_array for speed
     # where decomposition is done for the first (oldest) element only
     # and then timedeltas are added subsequently
-    mtimes = input2array(times, default=1.)
-    mtimes = np.array(mtimes, dtype=np.longdouble)
-    calendar = calendar.lower()
+    # no copy of float arrays, which are not changed in-place
+    if ( (type(times) is np.ndarray) and
+         (times.dtype in (np.float64, np.longdouble)) ):
+        mtimes = times
+    else:
+        mtimes = input2array(times, default=1.)
+    # float64 resolves microseconds of a year (< 2**53) but keep
+    # extended precision of longdouble input such as from date2num
+    if mtimes.dtype == np.longdouble:
+        ftype = np.longdouble
+    else:
+        ftype = np.float64
+    mtimes = np.asarray(mtimes, dtype=ftype)
 
     # year
-    fyear = np.trunc(mtimes)
-    fyear = np.where(mtimes < 0., fyear - 1., fyear)
+    fyear = np.floor(mtimes)
     year = fyear.astype(np.int64)
     frac_year = mtimes - fyear
-    days_year = np.longdouble(365)
-    diy = np.array([ [-9] + _cumdayspermonth,
-                     [-9] + _cumdayspermonth_leap ])
-    if calendar == 'decimal':
-        leap = ( (((year % 4) == 0) & ((year % 100) != 0)) |
-                 ((year % 400) == 0) ).astype(int)
-        fleap = leap.astype(np.longdouble)
-    elif calendar == 'decimal360':
-        leap  = np.zeros_like(mtimes, dtype=int)
-        fleap = np.zeros_like(mtimes, dtype=np.longdouble)
-        days_year = np.longdouble(360)
-        diy  = np.array([ [-9] + _cumdayspermonth_360,
-                          [-9] + _cumdayspermonth_360 ])
-    elif calendar == 'decimal365':
-        leap  = np.zeros_like(mtimes, dtype=int)
-        fleap = np.zeros_like(mtimes, dtype=np.longdouble)
-    elif calendar == 'decimal366':
-        leap  = np.ones_like(mtimes, dtype=int)
-        fleap = np.ones_like(mtimes, dtype=np.longdouble)
-    else:
+    # leap is 0/1 index array only for decimal calendar, scalar otherwise
+    try:
+        leap, days_year, diy = _decimal_dict[calendar]
+    except KeyError:
         raise ValueError(f'Unknown decimal calendar: {calendar}')
+    if leap is None:
+        leap = _is_leap_gregorian(year).view(np.int8)
+        days_year = ftype(days_year) + leap
+    else:
+        days_year = ftype(days_year)
     # change to microseconds to catch round-off errors,
     # i.e. cases 1 microsec less or greater than a second
     # cf. issue #187 of cftime
     # day of year in microseconds
-    fhoy = frac_year * (days_year + fleap) * 86400000000.
-    ihoy = np.rint(fhoy).astype(np.int64)
+    fhoy = frac_year * days_year * 86400000000.
+    ihoy = np.rint(fhoy, out=fhoy).astype(np.int64)
     # Done in cftime for issue #187
     # ihoy = np.where(ihoy%1000000 == 1,
     #                 np.floor(fhoy).astype(np.int64), ihoy)
     # ihoy = np.where(ihoy%1000000 == 999999,
     #                 np.ceil(fhoy).astype(np.int64), ihoy)
+    # quotients in-place in ihoy
     # microsecond
-    msecond = ihoy % 1000000
-    ihoy    = ihoy // 1000000
+    msecond = np.empty_like(ihoy)
+    np.divmod(ihoy, 1000000, out=(ihoy, msecond))
     # second
-    second = ihoy % 60
-    ihoy   = ihoy // 60
+    second = np.empty_like(ihoy)
+    np.divmod(ihoy, 60, out=(ihoy, second))
     # minute
-    minute = ihoy % 60
-    ihoy   = ihoy // 60
+    minute = np.empty_like(ihoy)
+    np.divmod(ihoy, 60, out=(ihoy, minute))
     # hour
-    hour = ihoy % 24
-    ihoy = ihoy // 24
+    hour = np.empty_like(ihoy)
+    np.divmod(ihoy, 24, out=(ihoy, hour))
     # day and month
     idoy = ihoy + 1
-    month = np.zeros_like(mtimes, dtype=np.int64)
-    day   = np.zeros_like(mtimes, dtype=np.int64)
-    for i in range(mtimes.size):
-        ii = np.where(idoy[i] > diy[leap[i], :])[0]
-        month[i] = ii[-1]
-        day[i]   = idoy[i] - diy[leap[i], month[i]]
+    # month is last index with diy < idoy
+    if calendar == 'decimal':
+        # search leap years only on the subset of leap years
+        month = np.asarray(np.searchsorted(diy[0], idoy))
+        ileap = leap.view(bool)
+        if ileap.any():
+            month[ileap] = np.searchsorted(diy[1], idoy[ileap])
+        month -= 1
+    else:
+        month = np.searchsorted(diy[leap], idoy) - 1
+    day = idoy - diy[leap, month]
 
     return year, month, day, hour, minute, second, msecond
 
@@ -999,73 +1366,77 @@ def _absolute2date(times, units):
     # should try similar to decode_dates_from_array for speed
     # where decomposition is done for the first (oldest) element only
     # and then timedeltas are added subsequently
-    mtimes = input2array(times, default=10101.)
-    mtimes = np.array(mtimes, dtype=np.longdouble)
+    # no copy of float arrays, which are not changed in-place
+    if ( (type(times) is np.ndarray) and
+         (times.dtype in (np.float64, np.longdouble)) ):
+        mtimes = times
+    else:
+        mtimes = input2array(times, default=10101.)
 
     if units == 'day as %Y%m%d.%f':
+        # microseconds since year 0 need more than float64 (> 2**53)
+        mtimes = np.asarray(mtimes, dtype=np.longdouble)
         # change to microseconds to catch round-off errors,
         # i.e. cases 1 microsec less or greater than a second
         # cf. issue #187 of cftime
         # day of year in microseconds
         fhoy = mtimes * 86400000000.
-        ihoy = np.rint(fhoy).astype(np.int64)
+        ihoy = np.rint(fhoy, out=fhoy).astype(np.int64)
         # Done in cftime for issue #187
         # ihoy = np.where(ihoy%1000000 == 1,
         #                 np.floor(fhoy).astype(np.int64), ihoy)
         # ihoy = np.where(ihoy%1000000 == 999999,
         #                 np.ceil(fhoy).astype(np.int64), ihoy)
+        # quotients in-place in ihoy
         # microsecond
-        msecond = ihoy % 1000000
-        ihoy    = ihoy // 1000000
+        msecond = np.empty_like(ihoy)
+        np.divmod(ihoy, 1000000, out=(ihoy, msecond))
         # second
-        second = ihoy % 60
-        ihoy   = ihoy // 60
+        second = np.empty_like(ihoy)
+        np.divmod(ihoy, 60, out=(ihoy, second))
         # minute
-        minute = ihoy % 60
-        ihoy   = ihoy // 60
+        minute = np.empty_like(ihoy)
+        np.divmod(ihoy, 60, out=(ihoy, minute))
         # hour
-        hour = ihoy % 24
-        ihoy = ihoy // 24
+        hour = np.empty_like(ihoy)
+        np.divmod(ihoy, 24, out=(ihoy, hour))
         # day
-        day = ihoy % 100
-        ihoy = ihoy // 100
-        # month
-        month = ihoy % 100
-        ihoy = ihoy // 100
-        # year
-        year = ihoy
+        day = np.empty_like(ihoy)
+        np.divmod(ihoy, 100, out=(ihoy, day))
+        # month and year
+        year, month = np.divmod(ihoy, 100)
     elif units == 'month as %Y%m.%f':
+        # float64 resolves microseconds of a month but keep
+        # extended precision of longdouble input such as from date2num
+        if mtimes.dtype == np.longdouble:
+            mtimes = np.asarray(mtimes, dtype=np.longdouble)
+        else:
+            mtimes = np.asarray(mtimes, dtype=np.float64)
         fmo     = mtimes % 1.  # month fraction
-        # month
-        mtimes -= fmo
-        month   = np.rint(mtimes % 100.).astype(np.int64)
-        # year
-        mtimes -= month
-        year    = np.rint(mtimes / 100.).astype(np.int64)
+        # year and month from integer YYYYMM
+        year, month = np.divmod((mtimes - fmo).astype(np.int64), 100)
         # day of month in microseconds
-        leap    = np.where((((year % 4) == 0) & ((year % 100) != 0)) |
-                           ((year % 400) == 0), 1, 0)
-        dim     = np.array([ [-9] + _dayspermonth,
-                             [-9] + _dayspermonth_leap ])
-        fhoy = dim[(leap, month)] * fmo * 86400000000.
-        ihoy = np.rint(fhoy).astype(np.int64)
+        leap    = _is_leap_gregorian(year).view(np.int8)
+        fhoy = _dim[leap, month] * fmo * 86400000000.
+        ihoy = np.rint(fhoy, out=fhoy).astype(np.int64)
         # Done in cftime for issue #187
         # ihoy = np.where(ihoy%1000000 == 1,
         #                 np.floor(fhoy).astype(np.int64), ihoy)
         # ihoy = np.where(ihoy%1000000 == 999999,
         #                 np.ceil(fhoy).astype(np.int64), ihoy)
+        # quotients in-place in ihoy
         # microsecond
-        msecond = ihoy % 1000000
-        ihoy    = ihoy // 1000000
+        msecond = np.empty_like(ihoy)
+        np.divmod(ihoy, 1000000, out=(ihoy, msecond))
         # second
-        second = ihoy % 60
-        ihoy   = ihoy // 60
+        second = np.empty_like(ihoy)
+        np.divmod(ihoy, 60, out=(ihoy, second))
         # minute
-        minute = ihoy % 60
-        ihoy   = ihoy // 60
+        minute = np.empty_like(ihoy)
+        np.divmod(ihoy, 60, out=(ihoy, minute))
         # hour
-        hour = ihoy % 24
-        ihoy = ihoy // 24
+        hour = np.empty_like(ihoy)
+        np.divmod(ihoy, 24, out=(ihoy, hour))
         # day
         day = ihoy
         # mtimes  = dim[(leap, month)] * fmo
@@ -1272,20 +1643,11 @@ def date2num(dates, units='', calendar=None, has_year_zero=None,
                                  has_year_zero=has_year_zero)
                         for dt in mmdates ]
         mdates = input2array(mmdates, default=cf.datetime(1990, 1, 1))
-    else:
-        mdates = input2array(dates, default=cf.real_datetime(1990, 1, 1))
 
     # if year, month, ... wanted, no need to go further
     if return_arrays:
-        out = np.array([ to_tuple(dt) for dt in mdates ])
-        year        = array2input(out[:, 0], dates)
-        month       = array2input(out[:, 1], dates)
-        day         = array2input(out[:, 2], dates)
-        hour        = array2input(out[:, 3], dates)
-        minute      = array2input(out[:, 4], dates)
-        second      = array2input(out[:, 5], dates)
-        microsecond = array2input(out[:, 6], dates)
-        return year, month, day, hour, minute, second, microsecond
+        return tuple( array2input(out, dates)
+                      for out in _dates2arrays(mdates) )
 
     # check if we can parse to cftime
     if icalendar in _cfcalendars:
@@ -1510,6 +1872,10 @@ def num2date(times, units='', calendar='standard',
             only_use_cftime_datetimes=only_use_cftime_datetimes,
             only_use_python_datetimes=only_use_python_datetimes,
             has_year_zero=has_year_zero)
+        # shortcut
+        if return_arrays:
+            return tuple( array2input(oo, times)
+                          for oo in _dates2arrays(out) )
         if only_use_pyjams_datetimes:
             out = [ datetime(*to_tuple(dt), calendar=calendar)
                     for dt in out ]
@@ -1537,28 +1903,20 @@ def num2date(times, units='', calendar='standard',
             microsecond = array2input(microsecond, times)
             return year, month, day, hour, minute, second, microsecond
 
-        out = np.empty_like(year, dtype=object)
+        # construct datetime objects element-wise without Python loop
         if ( (not only_use_pyjams_datetimes) and
              (not only_use_cftime_datetimes) and
              only_use_python_datetimes and
              (year.min() > 0) ):
-            for i in range(year.size):
-                out[i] = cf.real_datetime(year[i], month[i], day[i],
-                                          hour[i], minute[i], second[i],
-                                          microsecond[i])
+            dtfunc = cf.real_datetime
         elif ( (not only_use_pyjams_datetimes) and
                only_use_cftime_datetimes ):
-            for i in range(year.size):
-                out[i] = cf.datetime(year[i], month[i], day[i],
-                                     hour[i], minute[i], second[i],
-                                     microsecond[i])
+            dtfunc = cf.datetime
         else:
-            for i in range(year.size):
-                out[i] = datetime(year[i], month[i], day[i],
-                                  hour[i], minute[i], second[i],
-                                  microsecond[i],
-                                  calendar='decimal',
-                                  has_year_zero=has_year_zero)
+            dtfunc = partial(datetime, calendar='decimal',
+                             has_year_zero=has_year_zero)
+        out = np.frompyfunc(dtfunc, 7, 1)(year, month, day, hour, minute,
+                                          second, microsecond)
 
     # use cftime.num2date for Excel but return pyjams.datetime
     if calendar in _excelcalendars:
@@ -1570,21 +1928,12 @@ def num2date(times, units='', calendar='standard',
             only_use_python_datetimes=False,
             has_year_zero=has_year_zero)
 
-        # shortcut
+        # shortcuts
+        if return_arrays:
+            return tuple( array2input(out, times)
+                          for out in _dates2arrays(cfdates) )
         if format:
-            # Assure 4 digit years on all platforms
-            # see https://github.com/python/cpython/issues/76376
-            iform = format
-            if '%Y' in format:
-                format04 = format.replace('%Y', '%04Y')
-                try:
-                    dttest = cfdates[0].strftime(format04)
-                    if '4Y' in dttest:
-                        iform = format
-                    else:
-                        iform = format04
-                except ValueError:
-                    iform = format
+            iform = _year_format(format, cfdates[0])
             out = [ dt.strftime(iform) for dt in cfdates ]
             out = array2input(out, times)
             return out
@@ -1612,30 +1961,22 @@ def num2date(times, units='', calendar='standard',
             microsecond = array2input(microsecond, times)
             return year, month, day, hour, minute, second, microsecond
 
-        out = np.empty_like(year, dtype=object)
+        # construct datetime objects element-wise without Python loop
         if ( (not only_use_pyjams_datetimes) and
              (not only_use_cftime_datetimes) and
              only_use_python_datetimes and (year.min() > 0) ):
-            for i in range(year.size):
-                out[i] = cf.real_datetime(year[i], month[i], day[i],
-                                          hour[i], minute[i], second[i],
-                                          microsecond[i])
+            dtfunc = cf.real_datetime
         elif ( (not only_use_pyjams_datetimes) and
                only_use_cftime_datetimes ):
-            for i in range(year.size):
-                out[i] = cf.datetime(year[i], month[i], day[i],
-                                     hour[i], minute[i], second[i],
-                                     microsecond[i])
+            dtfunc = cf.datetime
         else:
-            for i in range(year.size):
-                out[i] = datetime(year[i], month[i], day[i],
-                                  hour[i], minute[i], second[i],
-                                  microsecond[i],
-                                  calendar=calendar,
-                                  has_year_zero=has_year_zero)
+            dtfunc = partial(datetime, calendar=calendar,
+                             has_year_zero=has_year_zero)
+        out = np.frompyfunc(dtfunc, 7, 1)(year, month, day, hour, minute,
+                                          second, microsecond)
 
     if return_arrays:
-        out = np.array([ to_tuple(dt) for dt in out ])
+        out = np.array(list(map(_get_ymdhmsms, out)))
         year        = array2input(out[:, 0], times)
         month       = array2input(out[:, 1], times)
         day         = array2input(out[:, 2], times)
@@ -1646,24 +1987,11 @@ def num2date(times, units='', calendar='standard',
         return year, month, day, hour, minute, second, microsecond
     else:
         if format:
-            # Assure 4 digit years on all platforms
-            # see https://github.com/python/cpython/issues/76376
-            iform = format
             if '%Y' in format:
-                years0 = [ dd.year < 0 for dd in out ]
-                if any(years0):
-                    y4 = '%05Y'
-                else:
-                    y4 = '%04Y'
-                format04 = format.replace('%Y', y4)
-                try:
-                    dttest = out[0].strftime(format04)
-                    if ('4Y' in dttest) or ('5Y' in dttest):
-                        iform = format
-                    else:
-                        iform = format04
-                except ValueError:
-                    iform = format
+                negative = any( dd.year < 0 for dd in out )
+            else:
+                negative = False
+            iform = _year_format(format, out[0], negative)
             out = [ dt.strftime(iform) for dt in out ]
 
         out = array2input(out, times)
@@ -1710,6 +2038,11 @@ class datetime(object):
     self.format (default %Y-%m-%d %H:%M:%S).
 
     """
+    # no instance __dict__ for many datetime objects from num2date
+    __slots__ = ('year', 'month', 'day', 'hour', 'minute', 'second',
+                 'microsecond', '_dayofwk', '_dayofyr', 'tzinfo', '_cf',
+                 'calendar', 'has_year_zero', 'datetime_compatible')
+
     # Python's datetime.datetime uses the proleptic Gregorian
     # calendar. This boolean is used to decide whether a
     # cftime.datetime instance can be converted to
@@ -1732,7 +2065,7 @@ class datetime(object):
         self._dayofwk = dayofwk
         self._dayofyr = dayofyr
         self.tzinfo = None
-        self.cf = None
+        self._cf = None
         if calendar:
             self.calendar = calendar.lower()
         else:
@@ -1749,24 +2082,39 @@ class datetime(object):
         if ( self.calendar and (self.calendar not in _cfcalendars) and
              (self.calendar not in _noncfcalendars) ):
             raise ValueError(f'Unknown calendar: {self.calendar}')
-        if self.calendar in _cfcalendars:
-            self.cf = cf.datetime(self.year, self.month, self.day,
-                                  self.hour, self.minute, self.second,
-                                  self.microsecond,
-                                  calendar=self.calendar,
-                                  has_year_zero=self.has_year_zero)
-            self.datetime_compatible = self.cf.datetime_compatible
-        elif self.calendar in _excelcalendars:
-            self.cf = cf.datetime(self.year, self.month, self.day,
-                                  self.hour, self.minute, self.second,
-                                  self.microsecond,
-                                  calendar='julian',
-                                  has_year_zero=self.has_year_zero)
-            self.datetime_compatible = self.cf.datetime_compatible
+        # same as cftime.datetime.datetime_compatible
+        if self.calendar == 'proleptic_gregorian':
+            self.datetime_compatible = True
+        elif self.calendar in ['standard', 'gregorian']:
+            self.datetime_compatible = ( (self.year, self.month, self.day) >=
+                                         (1582, 10, 15) )
         else:
             self.datetime_compatible = False
         self.assert_valid_date()
 
+    @property
+    def cf(self):
+        """
+        cftime.datetime instance for CF- and Excel calendars
+
+        Excel calendars give a cftime.datetime instance with the *julian*
+        calendar. The instance is only made on first access.
+
+        """
+        if self._cf is None:
+            if self.calendar in _cfcalendars:
+                icalendar = self.calendar
+            elif self.calendar in _excelcalendars:
+                icalendar = 'julian'
+            else:
+                return None
+            self._cf = cf.datetime(self.year, self.month, self.day,
+                                   self.hour, self.minute, self.second,
+                                   self.microsecond,
+                                   calendar=icalendar,
+                                   has_year_zero=self.has_year_zero)
+        return self._cf
+
     def assert_valid_date(self):
         """
         Check that datetime is a valid date for given calendar
@@ -1788,13 +2136,27 @@ class datetime(object):
         if (self.month < 1) or (self.month > 12):
             raise ValueError("Invalid month provided in {0!r}".format(self))
 
+        # days missing in mixed Julian/Gregorian calendar
+        if ( (self.year == 1582) and (self.month == 10) and
+             (self.day > 4) and (self.day < 15) and
+             (self.calendar in ['standard', 'gregorian']) ):
+            raise ValueError(
+                "{0!r} is not present in the mixed Julian/Gregorian"
+                " calendar".format(self))
+
         # day
         month_length = _month_lengths(self.year, self.calendar,
                                       self.has_year_zero)
-        if (self.day < 1) or (self.day > month_length[self.month - 1]):
+        if not (1 <= self.day <= month_length[self.month - 1]):
             raise ValueError(
                 "Invalid day number provided in {0!r}".format(self))
 
+        # time checked at once, individual fields only if invalid
+        if ( (0 <= self.hour <= 23) and (0 <= self.minute <= 59) and
+             (0 <= self.second <= 59) and
+             (0 <= self.microsecond <= 999999) ):
+            return
+
         # hour
         if (self.hour < 0) or (self.hour > 23):
             raise ValueError("Invalid hour provided in {0!r}".format(self))
@@ -1845,15 +2207,9 @@ class datetime(object):
 
         """
         if (self._dayofyr < 0) and self.calendar:
-            if self.calendar == 'decimal360':
-                # dayofyr = (self.month - 1) * 30 + self.day
-                dayofyr = _cumdayspermonth_360[self.month - 1] + self.day
-            else:
-                if _is_leap(self.year, self.calendar,
-                            has_year_zero=self.has_year_zero):
-                    dayofyr = _cumdayspermonth_leap[self.month - 1] + self.day
-                else:
-                    dayofyr = _cumdayspermonth[self.month - 1] + self.day
+            leap = _is_leap_year(self.year, self.calendar, self.has_year_zero)
+            dayofyr = (_cumdayspermonth_dict[self.calendar][leap][
+                self.month - 1] + self.day)
             # cache results for dayofyr
             self._dayofyr = dayofyr
             return dayofyr
@@ -1865,15 +2221,8 @@ class datetime(object):
         Number of days in current month
 
         """
-        if self.calendar == 'decimal360':
-            # return 30
-            return _dayspermonth_360[self.month - 1]
-        else:
-            if _is_leap(self.year, self.calendar,
-                        has_year_zero=self.has_year_zero):
-                return _dayspermonth_leap[self.month - 1]
-            else:
-                return _dayspermonth[self.month - 1]
+        return _month_lengths(self.year, self.calendar,
+                              self.has_year_zero)[self.month - 1]
 
     def format(self):
         """
@@ -7,7 +7,7 @@ Hydrosystems, Helmholtz Centre for Environmental Research - UFZ, Leipzig,
 Germany, and continued while at Institut National de Recherche pour
 l'Agriculture, l'Alimentation et l'Environnement (INRAE), Nancy, France.
 
-:copyright: Copyright 2012-2023 Matthias Cuntz, see AUTHORS.rst for details.
+:copyright: Copyright 2012-2026 Matthias Cuntz, see AUTHORS.rst for details.
 :license: MIT License, see LICENSE for details.
 
 .. moduleauthor:: Matthias Cuntz
@@ -24,10 +24,12 @@ History
     * Ported into pyjams, Oct 2021, Matthias Cuntz
     * More consistent docstrings, Jan 2022, Matthias Cuntz
     * Support pandas Series and DataFrame, Jun 2023, Matthias Cuntz
+    * No copy of input array, ignore masked entries of masked arrays,
+      Oct 2026, Matthias Cuntz
+    * Absolute difference in-place, Oct 2026, Matthias Cuntz
 
 """
 import numpy as np
-from .helper import input2array
 
 
 __all__ = ['closest']
@@ -43,7 +45,8 @@ def closest(arr, num, value=False):
     Parameters
     ----------
     arr : array_like
-        Array to search closest entry
+        Array to search closest entry.
+        Masked entries of masked arrays are not considered.
     num : number
         Number to which the closest entry is searched for in arr
     value : bool, optional
@@ -78,9 +81,15 @@ def closest(arr, num, value=False):
     3.131
 
     """
-    marr = input2array(arr)
+    if isinstance(arr, np.ma.MaskedArray):
+        marr = arr
+    else:
+        marr = np.atleast_1d(arr)
 
-    out = np.argmin(np.abs(marr - num))
+    # one temporary array for the absolute difference
+    dist = marr - num
+    np.abs(dist, out=dist)
+    out = np.argmin(dist)
     if value:
         return marr.flat[out]
     else:
@@ -43,6 +43,10 @@ History
     * Check that scalar is number in array2input, Oct 2023, Matthias Cuntz
     * Check if outin is Iterable even if inp is not in array2input,
       Nov 2023, Matthias Cuntz
+    * Use ndarray instead of masked array routines for masked input in
+      input2array, Oct 2026, Matthias Cuntz
+    * Determine undefined values only once and do not copy output for
+      shape comparison in array2input, Oct 2026, Matthias Cuntz
 
 """
 from collections.abc import Iterable
@@ -163,8 +167,10 @@ def input2array(inp, undef=None, default=1):
     """
     if isinstance(inp, Iterable):
         if isinstance(inp, np.ma.MaskedArray):
-            out = np.ma.where(isundef(inp, undef), default,
-                              inp).filled(default)
+            # plain ndarray routines on data and mask
+            dat = np.ma.getdata(inp)
+            out = np.where(isundef(dat, undef) | np.ma.getmaskarray(inp),
+                           default, dat)
         elif isinstance(inp, str):
             out = np.array([inp])
             out = np.where(isundef(out, undef), default, out)
@@ -261,7 +267,7 @@ def array2input(outin, inp, inp2=None, undef=None):
 
     if isinstance(inp, Iterable):
         if isinstance(inp, np.ma.MaskedArray):
-            if np.array(outin).shape == inp.shape:
+            if np.shape(outin) == inp.shape:
                 outout = np.ma.array(outin,
                                      mask=(isundef(inp, undef) | (inp.mask)))
             else:
@@ -270,9 +276,10 @@ def array2input(outin, inp, inp2=None, undef=None):
                 else:
                     outout = np.ma.array(outin)
         elif isinstance(inp, np.ndarray):
-            if np.array(outin).shape == inp.shape:
-                if np.any(isundef(inp, undef)):
-                    outout = np.where(isundef(inp, undef), undef, outin)
+            if np.shape(outin) == inp.shape:
+                iundef = isundef(inp, undef)
+                if np.any(iundef):
+                    outout = np.where(iundef, undef, outin)
                 else:
                     if isinstance(outin, np.ndarray):
                         outout = outin
@@ -292,16 +299,18 @@ def array2input(outin, inp, inp2=None, undef=None):
                 else:
                     outout = outin[0]
         elif isinstance(inp, (pd.DataFrame, pd.Series)):
-            if np.array(outin).shape == inp.shape:
-                if np.any(isundef(inp, undef)):
-                    outout = np.where(isundef(inp, undef), undef, outin)
+            if np.shape(outin) == inp.shape:
+                iundef = isundef(inp, undef)
+                if np.any(iundef):
+                    outout = np.where(iundef, undef, outin)
                 else:
                     if isinstance(outin, np.ndarray):
                         outout = outin
                     else:
                         outout = np.array(outin)
-                if np.any(np.isnan(inp)):
-                    outout = np.where(np.isnan(inp), np.nan, outout)
+                inan = np.isnan(inp)
+                if np.any(inan):
+                    outout = np.where(inan, np.nan, outout)
                 outout = type(inp)(outout)
                 outout.index = inp.index
             else:
@@ -311,10 +320,11 @@ def array2input(outin, inp, inp2=None, undef=None):
                     outout = np.array(outin)
                 outout = type(inp)(outout)
         else:
-            if np.array(outin).shape == np.array(inp).shape:
-                if np.any(isundef(np.array(inp), undef)):
-                    outout = np.where(isundef(np.array(inp), undef),
-                                      undef, outin)
+            ainp = np.array(inp)
+            if np.shape(outin) == ainp.shape:
+                iundef = isundef(ainp, undef)
+                if np.any(iundef):
+                    outout = np.where(iundef, undef, outin)
                 else:
                     outout = outin
             else:
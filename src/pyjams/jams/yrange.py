@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 from __future__ import division, absolute_import, print_function
+from functools import reduce
 import numpy as np
 from pyjams.jams.around import around
 from pyjams.const import eps
@@ -8,6 +9,45 @@ from pyjams.const import eps
 __all__ = ['yrange']
 
 
+def _minmaxexpom(i):
+    """
+    Minimum, maximum and decimal exponent of the maximum difference between
+    adjacent values of one input array of yrange
+    """
+    isnan = np.isnan(i)
+    if np.any(isnan):
+        arr = np.ma.array(i, mask=isnan)
+    elif np.ma.is_masked(i):
+        arr = i
+    else:
+        arr = None
+    if arr is None:
+        # no masked values: use faster ndarray routines
+        arr = np.asarray(i)
+        amin, amax, sort, log10 = np.amin, np.amax, np.sort, np.log10
+    else:
+        amin, amax, sort, log10 = (np.ma.amin, np.ma.amax, np.ma.sort,
+                                   np.ma.log10)
+    minarr = amin(arr)
+    maxarr = amax(arr)
+    # Round to max difference between adjacent values
+    if arr.size == 1:
+        expom = 0
+    else:
+        sarr    = sort(arr)
+        maxdiff = amax(np.diff(sarr))
+        if maxdiff == 0:
+            # constant array: same as single number
+            return minarr, maxarr, 0
+        expom   = log10(maxdiff)
+        if expom > 0:
+            expom = int(np.floor(expom + 10. * eps * 10.))
+        else:
+            expom = int(np.floor(expom - 10. * eps))
+
+    return minarr, maxarr, expom
+
+
 def yrange(*args, **kwargs):
     """
     Calculates plot range from input array
@@ -69,6 +109,9 @@ def yrange(*args, **kwargs):
     >>> print(yrange(a))
     [0.0, 100.0]
 
+    >>> print(yrange(np.full(10, 5.3)))
+    [5.0, 6.0]
+
     >>> a = np.ma.arange(102, dtype=float)
     >>> a[-1] = np.ma.masked
     >>> a[-2] = np.nan
@@ -113,40 +156,29 @@ def yrange(*args, **kwargs):
               Matthias Cuntz, Apr 2014 - assert
               Matthias Cuntz, Nov 2016 - const.tiny -> const.eps
               Matthias Cuntz, Nov 2019 - mask NaN values, e.g. from Pandas
+              Matthias Cuntz, Oct 2026 - ndarray routines if no masked values
+              Matthias Cuntz, Oct 2026 - statistics of all arrays first
+              Matthias Cuntz, Oct 2026 - shortcut for single number
+              Matthias Cuntz, Oct 2026 - constant arrays as single number
     """
     # Check input
     assert len(args) > 0, 'no input argument given.'
-    counter = 0
-    for i in args:
-        if np.any(np.isnan(i)):
-            arr = np.ma.array(i, mask=np.isnan(i))
-        else:
-            arr    = np.ma.array(i)
-        minarr = np.ma.amin(arr)
-        maxarr = np.ma.amax(arr)
-        # Round to max difference between adjacent values
-        if arr.size == 1:
-            expom = 0
-        else:
-            sarr    = np.ma.sort(arr)
-            maxdiff = np.ma.amax(np.diff(sarr))
-            expom   = np.ma.log10(maxdiff)
-            if expom > 0:
-                expom = int(np.floor(expom + 10. * eps * 10.))
-            else:
-                expom = int(np.floor(expom - 10. * eps))
-        if counter == 0:
-            minall   = minarr
-            maxall   = maxarr
-            expomall = expom
-        else:
-            minall   = np.minimum(minall, minarr)
-            maxall   = np.maximum(maxall, maxarr)
-            if expomall > 0:
-                expomall = np.maximum(expomall, expom)
-            else:
-                expomall = np.minimum(expomall, expom)
-        counter += 1
+    if (len(args) == 1) and (np.size(args[0]) == 1):
+        val = np.ravel(args[0])[0]
+        single = (not np.ma.is_masked(val)) and np.isfinite(val)
+    else:
+        single = False
+    if single:
+        # single number: no statistics of adjacent values needed
+        minall   = val
+        maxall   = val
+        expomall = 0
+    else:
+        stats = [_minmaxexpom(i) for i in args]
+        minall = min(ss[0] for ss in stats)
+        maxall = max(ss[1] for ss in stats)
+        expomall = reduce(lambda a, b: max(a, b) if a > 0 else min(a, b),
+                          (ss[2] for ss in stats))
 
     # Round range
     mini = around(minall, expomall, floor=True)
@@ -77,6 +77,14 @@ History
     * More consistent docstrings, Jan 2022, Matthias Cuntz
     * Raise Error if more than one component changed at once,
       Jul 2023, Matthias Cuntz
+    * Vectorized calculation of elementary effects along a trajectory
+      without groups, Oct 2026, Matthias Cuntz
+    * Morris measures of all factors at once in case of NaNs,
+      Oct 2026, Matthias Cuntz
+    * Separate routines for Morris measures with and without groups,
+      Oct 2026, Matthias Cuntz
+    * Store elementary effects of one trajectory contiguously in memory,
+      Oct 2026, Matthias Cuntz
 
 """
 import numpy as np
@@ -626,6 +634,41 @@ def Optimized_Groups(NumFact, lb, ub, r,
     return OptMatrix, OptOutVec[:, 0]
 
 
+def _nanmoments(SAmeas):
+    """
+    Mean of absolute values, mean, and standard deviation of each column,
+    ignoring NaNs
+
+    All columns are done at once with masked sums, i.e. without extracting
+    the non-NaN elements of each column.
+
+    Parameters
+    ----------
+    SAmeas : ndarray
+        (r, NumFact) individual sensitivity measures, possibly with NaNs
+
+    Returns
+    -------
+    AbsMu, Mu, Stdev : ndarray
+        (NumFact,) arrays with the mean of the absolute values, the mean,
+        and the standard deviation (ddof=1) of each column.
+        Stdev is 0 for columns with less than two valid elements.
+
+    """
+    valid = ~np.isnan(SAmeas)
+    nvalid = valid.sum(axis=0)
+    SAm = np.where(valid, SAmeas, 0.)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        AbsMu = np.abs(SAm).sum(axis=0) / nvalid
+        Mu = SAm.sum(axis=0) / nvalid
+        dev = np.where(valid, SAm - Mu[np.newaxis, :], 0.)
+        Stdev = np.where(nvalid > 1,
+                         np.sqrt((dev * dev).sum(axis=0) / (nvalid - 1)),
+                         0.)
+
+    return AbsMu, Mu, Stdev
+
+
 def Morris_Measure_Groups(NumFact, Sample, OutFact, Output, p=4,
                           Group=[], Diagnostic=False):
     """
@@ -697,122 +740,183 @@ def Morris_Measure_Groups(NumFact, Sample, OutFact, Output, p=4,
 
     Delt = p / (2. * (p - 1.))
 
-    if NumGroups != 0:
-        sizea = NumGroups
-        GroupMat = Group
-        GroupMat = GroupMat.transpose()
-        if Diagnostic:
-            print('NumGroups', NumGroups)
-    else:
-        sizea = NumFact
-    sizeb = sizea + 1
-
-    # r = Sample.shape[0]/sizeb
-    r = Sample.shape[0] // sizeb
-
     try:
         NumOutp = Output.shape[1]
     except:  # pragma: no cover
         NumOutp = 1
         Output = Output.reshape((Output.size, 1))
 
-    # For each Output
+    # NumGroups is fixed for a given design so select the variant once
     if NumGroups == 0:
-        # for every output: every factor is a line, columns are mu*, mu and std
-        OutMatrix = np.zeros((NumOutp * NumFact, 3))
+        return _mmg_nogroups(NumFact, Sample, OutFact, Output, NumOutp, Delt,
+                             Diagnostic=Diagnostic)
     else:
-        # for every output: every factor is a line, column is mu*
-        OutMatrix = np.zeros((NumOutp * NumFact, 1))
+        if Diagnostic:
+            print('NumGroups', NumGroups)
+        return _mmg_groups(NumFact, NumGroups, Sample, OutFact, Output,
+                           NumOutp, Delt, Diagnostic=Diagnostic)
 
+
+def _mmg_steps(Single_Sample, sizea):
+    """
+    Changes of factors along a single trajectory
+
+    Parameters
+    ----------
+    Single_Sample : ndarray
+        (sizea+1, NumFact) points of the trajectory
+    sizea : int
+        Number of steps in the trajectory
+
+    Returns
+    -------
+    A, Delta : ndarray
+        (NumFact, sizea) changes of all factors at each step and
+        the non-zero changes, which are 0 for factors with
+        lower bound == upper bound
+
+    """
+    A = (Single_Sample[1:sizea + 1, :] - Single_Sample[:sizea, :]).transpose()
+    Delta = A[np.where(A)]  # AAN TE PASSEN?
+    # If upper bound==lower bound then A==0 in all trajectories. Delta
+    # will have not the right dimensions then because these are
+    # filtered out with where. Fill in Delta==0 for these cases.
+    ii = np.where(np.sum(A, axis=0) == 0.)[0]
+    if ii.size > 0:
+        Delta = np.insert(Delta, ii, 0.)
+
+    return A, Delta
+
+
+def _mmg_nogroups(NumFact, Sample, OutFact, Output, NumOutp, Delt,
+                  Diagnostic=False):
+    """
+    Morris measures mu*, mu and stddev without groups
+
+    See Morris_Measure_Groups for parameters and returns.
+
+    """
+    sizea = NumFact
+    sizeb = sizea + 1
+
+    # r = Sample.shape[0]/sizeb
+    r = Sample.shape[0] // sizeb
+
+    # for every output: every factor is a line, columns are mu*, mu and std
+    OutMatrix = np.zeros((NumOutp * NumFact, 3))
     SAmeas_out = np.zeros((NumOutp * NumFact, r))
 
     for k in range(NumOutp):
         OutValues = Output[:, k]
 
         # For each trajectory
-        # vorm afhankelijk maken van group of niet...
-        SAmeas = np.zeros((NumFact, r))
+        # trajectories are rows so that each trajectory is filled contiguously
+        SAmeas = np.zeros((r, NumFact))
         for i in range(r):
-            # For each step j in the trajectory
             # Read the orientation matrix fact for the r-th sampling
             # Read the corresponding output values
             # Read the line of changing factors
             Single_Sample = Sample[i * sizeb:(i + 1) * sizeb, :]
             Single_OutValues = OutValues[i * sizeb:(i + 1) * sizeb]
-            # gives factor in change (or group)
-            Single_Facts = np.array(OutFact[i * sizeb:(i + 1) * sizeb],
-                                    dtype=int)
-
-            A = (Single_Sample[1:sizeb, :] -
-                 Single_Sample[:sizea, :]).transpose()
-            Delta = A[np.where(A)]  # AAN TE PASSEN?
-            # If upper bound==lower bound then A==0 in all trajectories. Delta
-            # will have not the right dimensions then because these are
-            # filtered out with where. Fill in Delta==0 for these cases.
-            ii = np.where(np.sum(A, axis=0) == 0.)[0]
-            if ii.size > 0:
-                Delta = np.insert(Delta, ii, 0.)
+            # gives factor in change
+            # OutFact can be 1D or a column as from Sampling_Function_2
+            Single_Facts = np.ravel(
+                OutFact[i * sizeb:(i + 1) * sizeb]).astype(np.intp)
+
+            A, Delta = _mmg_steps(Single_Sample, sizea)
 
             if Diagnostic:
                 print('A: ', A)
                 print('Delta: ', Delta)
                 print('Single_Facts: ', Single_Facts)
 
-            # For each point of the fixed trajectory, i.e. for each factor,
+            # For all points of the fixed trajectory, i.e. for each factor,
             # compute the values of the Morris function.
-            for j in range(sizea):
-                if NumGroups != 0:  # work with groups
-                    Auxfind = A[:, j]
-                    Change_factor = np.where(np.abs(Auxfind) > 1e-010)[0]
-                    for gk in Change_factor:
-                        SAmeas[gk, i] = np.abs(
-                            (Single_OutValues[j] - Single_OutValues[j + 1]) /
-                            Delt)  # nog niet volledig goe
-                else:
-                    if Delta[j] > 0.0:
-                        SAmeas[Single_Facts[j], i] = ((Single_OutValues[j+1] -
-                                                       Single_OutValues[j]) /
-                                                      Delt)
-                    else:
-                        SAmeas[Single_Facts[j], i] = ((Single_OutValues[j] -
-                                                       Single_OutValues[j + 1])
-                                                      / Delt)
+            # Sign of step is sign of Delta.
+            signs = np.where(Delta[:sizea] > 0., 1., -1.)
+            SAmeas[i, Single_Facts[:sizea]] = (
+                signs * np.diff(Single_OutValues) / Delt)
 
         # Compute Mu AbsMu and StDev
         if np.isnan(SAmeas).any():
-            AbsMu = np.zeros(NumFact)
-            Mu = np.zeros(NumFact)
-            Stdev = np.zeros(NumFact)
-
-            for j in range(NumFact):
-                SAm = SAmeas[j, :]
-                SAm = SAm[~np.isnan(SAm)]
-                rr = float(SAm.size)
-                AbsMu[j] = np.sum(np.abs(SAm)) / rr
-                if NumGroups == 0:
-                    Mu[j] = SAm.mean()
-                    if SAm.size > 1:
-                        Stdev[j] = np.std(SAm, ddof=1)
-                    else:
-                        Stdev[j] = 0.
+            AbsMu, Mu, Stdev = _nanmoments(SAmeas)
         else:
-            AbsMu = np.sum(np.abs(SAmeas), axis=1) / r
-            if NumGroups == 0:
-                Mu = SAmeas.mean(axis=1)
-                if SAmeas.shape[1] > 1:
-                    Stdev = np.std(SAmeas, ddof=1, axis=1)
-                else:
-                    Stdev = np.zeros(SAmeas.shape[0])
+            AbsMu = np.sum(np.abs(SAmeas), axis=0) / r
+            Mu = SAmeas.mean(axis=0)
+            if SAmeas.shape[0] > 1:
+                Stdev = np.std(SAmeas, ddof=1, axis=0)
             else:
-                Mu = np.zeros(NumFact)
-                Stdev = np.zeros(NumFact)
+                Stdev = np.zeros(SAmeas.shape[1])
+
+        OutMatrix[k * NumFact:k * NumFact + NumFact, 0] = AbsMu
+        OutMatrix[k * NumFact:k * NumFact + NumFact, 1] = Mu
+        OutMatrix[k * NumFact:k * NumFact + NumFact, 2] = Stdev
+
+        SAmeas_out[k * NumFact:k * NumFact + NumFact, :] = SAmeas.T
+
+    return SAmeas_out, OutMatrix
+
+
+def _mmg_groups(NumFact, NumGroups, Sample, OutFact, Output, NumOutp, Delt,
+                Diagnostic=False):
+    """
+    Morris measure mu* with groups
+
+    See Morris_Measure_Groups for parameters and returns.
+
+    """
+    sizea = NumGroups
+    sizeb = sizea + 1
+
+    # r = Sample.shape[0]/sizeb
+    r = Sample.shape[0] // sizeb
+
+    # for every output: every factor is a line, column is mu*
+    OutMatrix = np.zeros((NumOutp * NumFact, 1))
+    SAmeas_out = np.zeros((NumOutp * NumFact, r))
+
+    for k in range(NumOutp):
+        OutValues = Output[:, k]
+
+        # For each trajectory
+        # trajectories are rows so that each trajectory is filled contiguously
+        SAmeas = np.zeros((r, NumFact))
+        for i in range(r):
+            # For each step j in the trajectory
+            # Read the orientation matrix fact for the r-th sampling
+            # Read the corresponding output values
+            Single_Sample = Sample[i * sizeb:(i + 1) * sizeb, :]
+            Single_OutValues = OutValues[i * sizeb:(i + 1) * sizeb]
+
+            A, Delta = _mmg_steps(Single_Sample, sizea)
+
+            if Diagnostic:
+                # gives group in change
+                Single_Facts = np.array(OutFact[i * sizeb:(i + 1) * sizeb],
+                                        dtype=np.intp)
+                print('A: ', A)
+                print('Delta: ', Delta)
+                print('Single_Facts: ', Single_Facts)
+
+            # For each point of the fixed trajectory, i.e. for each group,
+            # compute the values of the Morris function.
+            for j in range(sizea):
+                Auxfind = A[:, j]
+                Change_factor = np.where(np.abs(Auxfind) > 1e-010)[0]
+                for gk in Change_factor:
+                    SAmeas[i, gk] = np.abs(
+                        (Single_OutValues[j] - Single_OutValues[j + 1]) /
+                        Delt)  # nog niet volledig goe
+
+        # Compute AbsMu
+        if np.isnan(SAmeas).any():
+            AbsMu = _nanmoments(SAmeas)[0]
+        else:
+            AbsMu = np.sum(np.abs(SAmeas), axis=0) / r
 
         OutMatrix[k * NumFact:k * NumFact + NumFact, 0] = AbsMu
-        if NumGroups == 0:
-            OutMatrix[k * NumFact:k * NumFact + NumFact, 1] = Mu
-            OutMatrix[k * NumFact:k * NumFact + NumFact, 2] = Stdev
 
-        SAmeas_out[k * NumFact:k * NumFact + NumFact, :] = SAmeas
+        SAmeas_out[k * NumFact:k * NumFact + NumFact, :] = SAmeas.T
 
     return SAmeas_out, OutMatrix
 
@@ -43,6 +43,10 @@ class TestAlphaEquH2O(unittest.TestCase):
         assert isinstance(alpha, float)
         assert np.around(alpha, 4) == 1.1123
 
+        # isotope as 0-d array
+        assert alpha_equ_h2o(T0, isotope=np.array(1)) == alpha
+        assert alpha_equ_h2o(T0, isotope=np.array(3)) == 1.
+
         # list
         T1 = [ tt + T0 for tt in T ]
         alpha = alpha_equ_h2o(T1, isotope=0)
@@ -63,6 +67,24 @@ class TestAlphaEquH2O(unittest.TestCase):
         alpha = alpha_equ_h2o(T1, isotope=2)
         self.assertEqual(_flatten(alpha, 4), [1.0117, 1.0107, 1.0102, 1.0094])
 
+        # float32
+        T1  = np.array(T, dtype=np.float32) + np.float32(T0)
+        alpha = alpha_equ_h2o(T1, isotope=2)
+        assert alpha.dtype == np.float32
+        self.assertEqual(_flatten(alpha, 4), [1.0117, 1.0107, 1.0102, 1.0094])
+        alpha = alpha_equ_h2o(T1[0], isotope=2)
+        assert isinstance(alpha, np.float32)
+        assert np.around(alpha, 4) == 1.0117
+
+        # output array
+        T1  = np.array(T) + T0
+        T1[0] = -9999.
+        out = np.empty(T1.shape)
+        alpha = alpha_equ_h2o(T1, isotope=2, out=out)
+        assert alpha is out
+        self.assertEqual(_flatten(out, 4), [-9999., 1.0107, 1.0102, 1.0094])
+        self.assertRaises(ValueError, alpha_equ_h2o, list(T1), out=out)
+
         # pandas.Series
         T1 = [ tt + T0 for tt in T ]
         d1 = [pd.to_datetime('2020-06-01 12:30'),
@@ -37,6 +37,14 @@ class TestAlphaKinH2O(unittest.TestCase):
                                 boundary=True, cappa=True) * 1000.
         self.assertEqual(np.around(epsilon, 4), -20.7076)
 
+        # 0-d arrays as arguments
+        epsilon = alpha_kin_h2o(isotope=np.array(1), eps=np.array(True))
+        self.assertEqual(np.around(epsilon * 1000., 4), 25.1153)
+        epsilon = alpha_kin_h2o(isotope=np.array(2), eps=True,
+                                greater1=np.array(False),
+                                boundary=np.array(1), cappa=np.array(True))
+        self.assertEqual(np.around(epsilon * 1000., 4), -20.7076)
+
 
 if __name__ == "__main__":
     unittest.main()
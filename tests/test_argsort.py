@@ -37,12 +37,33 @@ class TestArgsort(unittest.TestCase):
         assert argmax(a) == 2
         assert a[argmax(a)] == 6
 
+        # tuple and iterator
+        assert argmax(tuple(lst)) == 2
+        assert argmax(iter(lst)) == 2
+
+        # long list
+        a = lst * 100
+        assert argmax(a) == 2
+        assert isinstance(argmax(a), int)
+        # long lists with NaN or mixed integers and floats as Python
+        nan = float('nan')
+        assert argmax([1, nan, 3]) == 2
+        assert argmax([1, nan, 3] * 200) == argmax([1, nan, 3])
+        assert argmax([2**53, 2**53 + 1]) == 1
+        assert argmax([2**53, 2**53 + 1] + [1.0] * 600) == 1
+
         # pandas
         df = pd.Series(lst)
         df.index = pd.date_range('2022-01-01', periods=len(lst))
         assert argmax(df) == 2
         assert df.iloc[argmax(df)] == 6
 
+        # other array types with own method
+        class Duck(list):
+            def argmax(self, *args, **kwargs):
+                return -1
+        assert argmax(Duck(lst)) == -1
+
         # from numpy.argmax docstring
         a = np.arange(6).reshape(2, 3) + 10
         assert argmax(a) == 5
@@ -82,6 +103,20 @@ class TestArgsort(unittest.TestCase):
         assert argmin(a) == 0
         assert a[argmin(a)] == 0
 
+        # tuple and iterator
+        assert argmin(tuple(lst[1:])) == 3
+        assert argmin(iter(lst[1:])) == 3
+
+        # long list
+        a = lst[1:] * 100
+        assert argmin(a) == 3
+        # long lists with NaN or mixed integers and floats as Python
+        nan = float('nan')
+        assert argmin([1, nan, 3]) == 0
+        assert argmin([1, nan, 3] * 200) == argmin([1, nan, 3])
+        assert argmin([-2**53, -2**53 - 1]) == 1
+        assert argmin([-2**53, -2**53 - 1] + [1.0] * 600) == 1
+
         # pandas
         df = pd.Series(lst)
         df.index = pd.date_range('2022-01-01', periods=len(lst))
@@ -140,6 +175,23 @@ class TestArgsort(unittest.TestCase):
         b = [ a[i] for i in ii ]
         self.assertEqual(b, slst[::-1])
 
+        # long list
+        a = lst * 100
+        self.assertEqual(argsort(a),
+                         sorted(range(len(a)), key=a.__getitem__))
+        self.assertEqual(argsort(a, reverse=True),
+                         sorted(range(len(a)), key=a.__getitem__,
+                                reverse=True))
+        # long lists with NaN or mixed integers and floats as sorted
+        nan = float('nan')
+        for a in [[1, nan, 3] * 200,
+                  [2**53 + 1, 2**53] * 100 + [1.0] * 100]:
+            self.assertEqual(argsort(a),
+                             sorted(range(len(a)), key=a.__getitem__))
+            self.assertEqual(argsort(a, reverse=True),
+                             sorted(range(len(a)), key=a.__getitem__,
+                                    reverse=True))
+
         # pandas
         df = pd.Series(lst)
         df.index = pd.date_range('2022-01-01', periods=len(lst))
@@ -45,6 +45,14 @@ class TestClosest(unittest.TestCase):
         self.assertEqual(ii, (10, 1))
         assert df2.iloc[ii] == 3.1
 
+        # masked array
+        marr = np.ma.array(arr, mask=(arr == 3.1))
+        assert closest(marr, 3.125) == 32
+        assert closest(marr, 3.125, value=True) == 3.2
+
+        # list
+        assert closest(list(arr), 3.125) == 31
+
 
 if __name__ == "__main__":
     unittest.main()
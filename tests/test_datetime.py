@@ -1257,6 +1257,55 @@ class TestDatetime(unittest.TestCase):
         dt2.microsecond = 0
         assert dt1 == dt2
 
+        # vectorized integer Julian days
+        from pyjams.class_datetime import _int_julian_day_from_date
+        from pyjams.class_datetime import _int_julian_day_from_dates
+        for calendar in self._cfcalendars + self._decimalcalendars:
+            ist = _int_julian_day_from_dates(self.year, self.month, self.day,
+                                             calendar)
+            soll = [ _int_julian_day_from_date(self.year[i], self.month[i],
+                                               self.day[i], calendar)
+                     for i in range(len(self.year)) ]
+            self.assertEqual(list(ist), soll)
+
+        # negative integer decimal year
+        dt = num2date([-5., -4.5], calendar='decimal')
+        assert (dt[0].year, dt[0].month, dt[0].day) == (-5, 1, 1)
+        assert (dt[1].year, dt[1].month, dt[1].day) == (-5, 7, 2)
+
+        # two-digit year
+        dt = datetime(1972, 2, 28, 20, 20, 0, 12)
+        assert dt.strftime('%y %j %H:%M.%f') == '72 059 20:20.000012'
+
+        # timedelta of more than one year in 360_day calendar
+        dt = datetime(0, 10, 10, calendar='360_day', has_year_zero=True)
+        dt1 = dt + timedelta(days=366)
+        dt2 = dt - timedelta(days=366)
+        assert (dt1.year, dt1.month, dt1.day) == (1, 10, 16)
+        assert (dt2.year, dt2.month, dt2.day) == (-1, 10, 4)
+        # large timedelta
+        for calendar in ['proleptic_gregorian', 'julian', 'noleap']:
+            dt = datetime(2000, 1, 1, calendar=calendar)
+            ndays = 1000000
+            cdt = cf.datetime(2000, 1, 1, calendar=calendar)
+            cdt1 = cdt + timedelta(days=ndays)
+            dt1 = dt + timedelta(days=ndays)
+            assert ((dt1.year, dt1.month, dt1.day) ==
+                    (cdt1.year, cdt1.month, cdt1.day))
+
+        # cftime.datetime instance
+        dt = datetime(1582, 10, 4, calendar='standard')
+        assert dt.cf == cf.datetime(1582, 10, 4, calendar='standard')
+        assert not dt.datetime_compatible
+        dt = datetime(1582, 10, 15, calendar='standard')
+        assert dt.datetime_compatible
+        assert datetime(1990, 1, 1, calendar='decimal').cf is None
+
+        # month lengths of 360_day calendar
+        dt = datetime(2001, 2, 30, calendar='360_day')
+        assert dt.dayofyr() == 60
+        assert dt.daysinmonth() == 30
+
         # errors
 
         # # calendar of cftime
@@ -1273,6 +1322,8 @@ class TestDatetime(unittest.TestCase):
         self.assertRaises(ValueError, datetime, 1900, 1, 1, 1, 61, 1, 1)
         self.assertRaises(ValueError, datetime, 1900, 1, 1, 1, 1, 61, 1)
         self.assertRaises(ValueError, datetime, 1900, 1, 1, 1, 1, 1, -1)
+        self.assertRaises(ValueError, datetime, 1582, 10, 10,
+                          calendar='standard')
         # illegal isoformat
         dt = datetime(1990, 1, 1)
         self.assertRaises(ValueError, dt.isoformat, timespec='test')
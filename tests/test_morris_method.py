@@ -150,6 +150,26 @@ class TestMorrisMethod(unittest.TestCase):
         self.assertEqual(list(np.around(sa[0:5].squeeze(), 3)),
                          [-0.579, -0.009, -0.239, -0.864, 0.876])
 
+    def test_r_10_column(self):
+        import numpy as np
+        from pyjams.morris_method import Sampling_Function_2
+        from pyjams.morris_method import Morris_Measure_Groups
+
+        nt     = 10
+        nsteps = 6
+        mat, vec = Sampling_Function_2(nsteps, self.nparam, nt,
+                                       self.LB, self.UB)
+        out = np.random.random(mat.shape[0])
+
+        # OutFact as column from Sampling_Function_2 or 1D
+        self.assertEqual(vec.shape, (nt * (self.nparam + 1), 1))
+        sa1, res1 = Morris_Measure_Groups(self.nparam, mat, vec, out,
+                                          p=nsteps)
+        sa2, res2 = Morris_Measure_Groups(self.nparam, mat, vec.ravel(), out,
+                                          p=nsteps)
+        self.assertTrue(np.array_equal(sa1, sa2, equal_nan=True))
+        self.assertTrue(np.array_equal(res1, res2, equal_nan=True))
+
     def test_groups(self):
         import numpy as np
         from pyjams import morris_sampling, elementary_effects
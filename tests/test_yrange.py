@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+"""
+This is the unittest for yrange module.
+
+python -m unittest -v tests/test_yrange.py
+python -m pytest --cov=pyjams --cov-report term-missing -v tests/test_yrange.py
+
+"""
+import unittest
+
+
+class TestYrange(unittest.TestCase):
+    """
+    Tests for jams/yrange.py
+    """
+
+    def test_yrange(self):
+        import warnings
+        import numpy as np
+        from pyjams.jams.yrange import yrange
+
+        self.assertEqual(yrange(range(102)), [0., 101.])
+        self.assertEqual(yrange(np.arange(102) - 10., symmetric=True),
+                         [-91., 91.])
+
+        # masked values and NaN
+        a = np.ma.arange(102, dtype=float)
+        a[-1] = np.ma.masked
+        a[-2] = np.nan
+        self.assertEqual(yrange(a), [0., 99.])
+
+        # constant array same as single number, without warning
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            self.assertEqual(yrange(np.full(10, 5.3)), [5., 6.])
+            self.assertEqual(yrange(np.full(10, 5.3)), yrange(5.3))
+            a = np.ma.array([2., 2., 7.], mask=[0, 0, 1])
+            self.assertEqual(yrange(a), [2., 2.])
+
+
+if __name__ == "__main__":
+    unittest.main()